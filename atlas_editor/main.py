@@ -11,7 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QPixmapCache
 
 from src.ui import MainWindow
 
@@ -33,6 +33,9 @@ def main():
     font = QFont("Segoe UI", 9)
     app.setFont(font)
     
+    # Room for shared tile thumbnails (limit is in KB; Qt's default is 10 MB)
+    QPixmapCache.setCacheLimit(64 * 1024)
+    
     # Create and show main window
     window = MainWindow()
     window.show()
@@ -1,11 +1,11 @@
 from .transform import Transform, SIDES, get_opposite_side, rotate_side, flip_side
-from .serialization import save_atlas, load_atlas, cleanup_extraction
+from .serialization import save_atlas, load_atlas, cleanup_extraction, resolve_tile_path
 from .propagation import propagate_rule, propagate_all_rules
 from .validation import validate_atlas, ValidationResult
 
 __all__ = [
     'Transform', 'SIDES', 'get_opposite_side', 'rotate_side', 'flip_side',
-    'save_atlas', 'load_atlas', 'cleanup_extraction',
+    'save_atlas', 'load_atlas', 'cleanup_extraction', 'resolve_tile_path',
     'propagate_rule', 'propagate_all_rules',
     'validate_atlas', 'ValidationResult'
 ]
@@ -6,7 +6,8 @@ generate equivalent rules for all transformed variants of those tiles.
 """
 
 from typing import TYPE_CHECKING
-from .transform import Transform, SIDES, get_all_transforms
+from .transform import Transform, get_all_transforms, _SIDE_BETWEEN
+from ..models.rule import Side
 
 if TYPE_CHECKING:
     from ..models import Atlas, AdjacencyRule, Tile
@@ -26,24 +27,56 @@ def propagate_rule(atlas: 'Atlas', rule: 'AdjacencyRule') -> list['AdjacencyRule
     Returns:
         List of newly created rules (not including the original)
     """
-    from ..models import Tile
+    new_keys = _propagated_rule_keys(atlas, rule, _index_tiles(atlas), {})
+    return atlas.bulk_add_rules(
+        (tile_id, side, neighbor_id, rule.weight, True)
+        for tile_id, side, neighbor_id in new_keys
+    )
+
+
+def _index_tiles(atlas: 'Atlas') -> dict[str, 'Tile']:
+    """Build an id -> tile map in a single pass over atlas.tiles."""
+    tiles_by_id: dict[str, 'Tile'] = {}
+    for tile in atlas.tiles:
+        tiles_by_id.setdefault(tile.id, tile)
+    return tiles_by_id
+
+
+def _propagated_rule_keys(atlas: 'Atlas', rule: 'AdjacencyRule',
+                          tiles_by_id: dict[str, 'Tile'],
+                          target_indexes: dict[str, dict[Transform, 'Tile']]) -> list[tuple[str, Side, str]]:
+    """
+    Compute the (tile_id, side, neighbor_id) keys a rule propagates to.
     
+    Only reads tiles and never mutates the atlas, so the results of many rules
+    can be computed first and inserted in one pass. tiles_by_id comes from
+    _index_tiles; target_indexes caches {Transform: Tile} per base tile id and
+    is filled lazily, so it can be shared across calls.
+    """
     # Get the source and target tiles
-    source_tile = atlas.get_tile(rule.tile_id)
-    target_tile = atlas.get_tile(rule.neighbor_id)
+    source_tile = tiles_by_id.get(rule.tile_id)
+    target_tile = tiles_by_id.get(rule.neighbor_id)
     
     if not source_tile or not target_tile:
         return []
     
     # Get all variants of both base tiles
     source_variants = atlas.get_tiles_for_base(source_tile.base_tile_id)
-    target_variants = atlas.get_tiles_for_base(target_tile.base_tile_id)
+    if len(source_variants) <= 1:
+        return []  # Only the original tile itself, nothing to propagate to
+    
+    target_by_transform = target_indexes.get(target_tile.base_tile_id)
+    if target_by_transform is None:
+        target_by_transform = {}
+        for tv in atlas.get_tiles_for_base(target_tile.base_tile_id):
+            target_by_transform.setdefault(Transform(tv.rotation, tv.flip_x, tv.flip_y), tv)
+        target_indexes[target_tile.base_tile_id] = target_by_transform
     
     # Build transform objects for source and target
     source_transform = Transform(source_tile.rotation, source_tile.flip_x, source_tile.flip_y)
     target_transform = Transform(target_tile.rotation, target_tile.flip_x, target_tile.flip_y)
     
-    new_rules = []
+    new_keys = []
     
     for src_variant in source_variants:
         if src_variant.id == rule.tile_id:
@@ -69,27 +102,14 @@ def propagate_rule(atlas: 'Atlas', rule: 'AdjacencyRule') -> list['AdjacencyRule
         # target_var_transform = relative_transform • target_transform
         target_var_transform = target_transform.compose(relative_transform)
         
-        # Find the target variant with this transform
-        target_variant = None
-        for tv in target_variants:
-            if (tv.rotation == target_var_transform.rotation and 
-                tv.flip_x == target_var_transform.flip_x and 
-                tv.flip_y == target_var_transform.flip_y):
-                target_variant = tv
-                break
+        # Find the target variant with this transform (transforms are interned,
+        # so this hashes an int and matches by identity)
+        target_variant = target_by_transform.get(target_var_transform)
         
         if target_variant:
-            # Create the propagated rule
-            new_rule = atlas.add_rule(
-                tile_id=src_variant.id,
-                side=new_side,
-                neighbor_id=target_variant.id,
-                weight=rule.weight,
-                auto_generated=True
-            )
-            new_rules.append(new_rule)
+            new_keys.append((src_variant.id, new_side, target_variant.id))
     
-    return new_rules
+    return new_keys
 
 
 def propagate_all_rules(atlas: 'Atlas') -> int:
@@ -108,13 +128,25 @@ def propagate_all_rules(atlas: 'Atlas') -> int:
     # Remove existing auto-generated rules
     atlas.remove_auto_rules()
     
-    # Propagate each manual rule
-    total_new = 0
-    for rule in manual_rules:
-        new_rules = propagate_rule(atlas, rule)
-        total_new += len(new_rules)
-    
-    return total_new
+    # Index tiles once for the whole pass; propagation adds rules but never tiles
+    tiles_by_id = _index_tiles(atlas)
+    target_indexes: dict[str, dict[Transform, 'Tile']] = {}
+    
+    # Compute the propagated keys of every manual rule up front, then insert them
+    # in a single pass so the atlas is only mutated in one place
+    pending = [
+        (rule, _propagated_rule_keys(atlas, rule, tiles_by_id, target_indexes))
+        for rule in manual_rules
+    ]
+    
+    # Weight is read lazily at insert time: an earlier insert may have updated this rule
+    atlas.bulk_add_rules(
+        (tile_id, side, neighbor_id, rule.weight, True)
+        for rule, new_keys in pending
+        for tile_id, side, neighbor_id in new_keys
+    )
+    
+    return sum(len(new_keys) for _, new_keys in pending)
 
 
 def ensure_tile_variants_for_rule(atlas: 'Atlas', rule: 'AdjacencyRule') -> list['Tile']:
@@ -164,7 +196,8 @@ def ensure_tile_variants_for_rule(atlas: 'Atlas', rule: 'AdjacencyRule') -> list
     # Create missing variants for both tiles
     for base_id in [source_tile.base_tile_id, target_tile.base_tile_id]:
         for t in transforms_to_create:
-            tile_id = f"{base_id}_{t.suffix}" if t.suffix else base_id
+            suffix = t.suffix
+            tile_id = f"{base_id}_{suffix}" if suffix else base_id
             if not atlas.get_tile(tile_id):
                 new_tile = atlas.add_tile_variant(
                     base_id, 
@@ -177,14 +210,14 @@ def ensure_tile_variants_for_rule(atlas: 'Atlas', rule: 'AdjacencyRule') -> list
     return new_tiles
 
 
-def _transform_side_between(side: str, from_transform: Transform, to_transform: Transform) -> str:
+def _transform_side_between(side: Side, from_transform: Transform, to_transform: Transform) -> Side:
     """
     Calculate which side in to_transform's frame corresponds to 'side' in from_transform's frame.
     
     Both transforms are relative to the base tile.
     """
-    # Find the original side (in base tile frame) that becomes 'side' in from_transform
-    original_side = from_transform.inverse_side(side)
-    
-    # Apply to_transform to get the side in the new frame
-    return to_transform.apply_to_side(original_side)
+    # Precomputed: inverse of from_transform, then to_transform, for every side
+    return _SIDES_BY_INDEX[_SIDE_BETWEEN[(from_transform.code << 6) | (to_transform.code << 2) | side]]
+
+
+_SIDES_BY_INDEX: tuple[Side, ...] = tuple(Side)
@@ -4,14 +4,44 @@ Uses .tr (tiles rules) ZIP format with bundled tile images.
 All tile images are stored inside the archive.
 """
 
+import hashlib
 import json
+import os
 import zipfile
+import zlib
 import shutil
-import tempfile
+from itertools import islice
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
 
-from ..models import Atlas
+try:
+    import orjson  # optional, much faster (de)serialization of large rule lists
+except ImportError:
+    orjson = None
+
+from ..models import Atlas, BaseTile, Tile, AdjacencyRule
+
+# Image formats that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is in the archive
+_PRECOMPRESSED_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+# Rows of atlas.json joined per write; every write into a ZIP entry pays for a
+# CRC update and a compressor call, which dominated saving with one write per row
+_JSON_CHUNK_ROWS = 2048
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Decode UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def save_atlas(atlas: Atlas, file_path: Union[str, Path]) -> None:
@@ -34,6 +64,10 @@ def save_atlas(atlas: Atlas, file_path: Union[str, Path]) -> None:
     if not file_path.suffix == '.tr':
         file_path = file_path.with_suffix('.tr')
     
+    # Tiles not yet pulled out of the archive this atlas was loaded from must be
+    # on disk before that archive can be overwritten
+    _extract_pending_tiles(atlas)
+    
     # Determine where to find source images
     # If loaded from .tr, use extraction dir; otherwise use atlas file's directory
     if hasattr(atlas, '_extraction_dir') and atlas._extraction_dir:
@@ -43,11 +77,18 @@ def save_atlas(atlas: Atlas, file_path: Union[str, Path]) -> None:
     else:
         source_base = Path('.')
     
-    # Create a temporary directory to build the archive contents
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        tiles_dir = temp_path / 'tiles'
-        tiles_dir.mkdir()
+    # Write the archive in a single pass: tiles are streamed straight from their
+    # source files and atlas.json is written from memory at the end.
+    # Deflate (level 6) is the default for atlas.json and uncompressed image formats.
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        # Archive names already used (case-folded, so the archive still extracts
+        # cleanly on case-insensitive filesystems)
+        used_names: set[str] = set()
+        # Archive name of each distinct image, keyed by content digest, so
+        # base tiles with identical image files share one archive entry
+        names_by_digest: dict[bytes, str] = {}
+        # Directory listings for the source lookups below, one scandir per directory
+        listings: dict[Path, frozenset[str]] = {}
         
         # Copy tile images and build base_tiles list with archive-relative paths
         updated_base_tiles = []
@@ -57,30 +98,37 @@ def save_atlas(atlas: Atlas, file_path: Union[str, Path]) -> None:
             
             # Try different locations to find the image
             found_path = None
-            if source_path.is_absolute() and source_path.exists():
+            if source_path.is_absolute() and _path_exists(source_path, listings):
                 found_path = source_path
-            elif (source_base / source_path).exists():
+            elif _path_exists(source_base / source_path, listings):
                 found_path = source_base / source_path
-            elif source_path.exists():
+            elif _path_exists(source_path, listings):
                 found_path = source_path
             # Try just the filename in tiles subfolder
-            elif (source_base / 'tiles' / source_path.name).exists():
+            elif _path_exists(source_base / 'tiles' / source_path.name, listings):
                 found_path = source_base / 'tiles' / source_path.name
             
-            if found_path and found_path.exists():
-                # Copy to tiles folder with just the filename
-                dest_name = found_path.name
-                # Handle duplicate names by adding counter
-                dest_path = tiles_dir / dest_name
-                counter = 1
-                while dest_path.exists():
-                    stem = found_path.stem
-                    suffix = found_path.suffix
-                    dest_name = f"{stem}_{counter}{suffix}"
-                    dest_path = tiles_dir / dest_name
-                    counter += 1
-                
-                shutil.copy2(found_path, dest_path)
+            if found_path:
+                # Each image is opened once: hashed, then copied from the same handle
+                with open(found_path, 'rb') as src:
+                    digest = _file_digest(src)
+                    dest_name = names_by_digest.get(digest)
+                    if dest_name is None:
+                        # Store in tiles folder with just the filename
+                        dest_name = found_path.name
+                        # Handle duplicate names by adding counter
+                        counter = 1
+                        while dest_name.casefold() in used_names:
+                            dest_name = f"{found_path.stem}_{counter}{found_path.suffix}"
+                            counter += 1
+                        used_names.add(dest_name.casefold())
+                        names_by_digest[digest] = dest_name
+                        
+                        zinfo = zipfile.ZipInfo.from_file(found_path, f'tiles/{dest_name}')
+                        zinfo.compress_type = _tile_compression(found_path)
+                        src.seek(0)
+                        with zf.open(zinfo, 'w') as dst:
+                            shutil.copyfileobj(src, dst)
                 
                 # Store ONLY archive-relative path (use 'source' key to match BaseTile.from_dict)
                 updated_base_tiles.append({
@@ -99,29 +147,72 @@ def save_atlas(atlas: Atlas, file_path: Union[str, Path]) -> None:
                     'height': base_tile.height
                 })
         
-        # Build atlas data with relative paths only
-        atlas_data = {
-            'version': atlas.version,
-            'settings': atlas.settings.to_dict(),
-            'base_tiles': updated_base_tiles,
-            'tiles': [t.to_dict() for t in atlas.tiles],
-            'rules': [r.to_dict() for r in atlas.rules]
-        }
-        
-        # Write atlas.json
-        with open(temp_path / 'atlas.json', 'w', encoding='utf-8') as f:
-            json.dump(atlas_data, f, indent=2, ensure_ascii=False)
-        
-        # Create ZIP archive
-        with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-            zf.write(temp_path / 'atlas.json', 'atlas.json')
-            for tile_file in tiles_dir.iterdir():
-                zf.write(tile_file, f'tiles/{tile_file.name}')
+        # Write atlas.json with relative paths only
+        with zf.open('atlas.json', 'w') as f:
+            _write_atlas_json(f, atlas, updated_base_tiles)
     
     atlas.file_path = str(file_path)
     atlas.modified = False
 
 
+def _path_exists(path: Path, listings: dict[Path, frozenset[str]]) -> bool:
+    """
+    Path.exists() answered from a cached listing of the parent directory.
+    Names not in the listing fall back to a real stat, so case-insensitive
+    filesystems behave as before.
+    """
+    names = listings.get(path.parent)
+    if names is None:
+        try:
+            with os.scandir(path.parent) as it:
+                names = frozenset(entry.name for entry in it)
+        except OSError:
+            names = frozenset()
+        listings[path.parent] = names
+    return path.name in names or path.exists()
+
+
+def _file_digest(f: BinaryIO) -> bytes:
+    """Hash the rest of a binary file object in fixed-size chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: f.read(65536), b''):
+        h.update(chunk)
+    return h.digest()
+
+
+def _tile_compression(path: Path) -> int:
+    """Pick the ZIP compression method for a tile image."""
+    if path.suffix.lower() in _PRECOMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _write_atlas_json(f: BinaryIO, atlas: Atlas, base_tiles: list[dict]) -> None:
+    """
+    Stream atlas.json to a binary file object.
+    
+    Each tile and rule is encoded on its own compact line. Lines are written in
+    chunks of _JSON_CHUNK_ROWS, so no full list of rule dicts or full JSON
+    string is held in memory.
+    """
+    def write_array(key: bytes, items) -> None:
+        f.write(b',\n"' + key + b'":[')
+        lines = map(_json_dumps, items)
+        separator = b'\n'
+        while chunk := list(islice(lines, _JSON_CHUNK_ROWS)):
+            f.write(separator)
+            f.write(b',\n'.join(chunk))
+            separator = b',\n'
+        f.write(b'\n]')
+    
+    f.write(b'{"version":' + _json_dumps(atlas.version))
+    f.write(b',\n"settings":' + _json_dumps(atlas.settings.to_dict()))
+    write_array(b'base_tiles', base_tiles)
+    write_array(b'tiles', map(Tile.to_dict, atlas.tiles))
+    write_array(b'rules', map(AdjacencyRule.to_dict, atlas.rules))
+    f.write(b'\n}\n')
+
+
 def load_atlas(file_path: Union[str, Path]) -> Atlas:
     """
     Load an atlas from a .tr file (ZIP archive with tiles).
@@ -140,21 +231,21 @@ def load_atlas(file_path: Union[str, Path]) -> Atlas:
     # Create extraction directory next to the .tr file (hidden folder)
     extract_dir = file_path.parent / f".{file_path.stem}_cache"
     
-    # Extract archive
+    # Only atlas.json is read up front; tile images are extracted on first
+    # access through resolve_tile_path
     with zipfile.ZipFile(file_path, 'r') as zf:
-        # Read atlas.json
-        with zf.open('atlas.json') as f:
-            data = json.load(f)
-        
-        # Extract ALL files (including tiles)
-        zf.extractall(extract_dir)
+        data = _json_loads(zf.read('atlas.json'))
+        members = set(zf.namelist())
     
-    # Update base_tile paths to absolute paths pointing to extracted files
+    # Update base_tile paths to absolute paths pointing to (future) extracted files
+    pending_tiles = {}
     for bt in data.get('base_tiles', []):
         source_path = bt.get('source', '')
         # Convert archive-relative path to absolute extracted path
-        extracted_path = extract_dir / source_path
-        bt['source'] = str(extracted_path)
+        extracted_path = str(extract_dir / source_path)
+        bt['source'] = extracted_path
+        if source_path in members:
+            pending_tiles[extracted_path] = source_path
     
     atlas = Atlas.from_dict(data)
     atlas.file_path = str(file_path)
@@ -162,13 +253,71 @@ def load_atlas(file_path: Union[str, Path]) -> Atlas:
     
     # Store extraction directory for cleanup and for saving later
     atlas._extraction_dir = str(extract_dir)
+    # Archive members not extracted yet, keyed by their extracted path
+    atlas._archive_path = str(file_path)
+    atlas._pending_tiles = pending_tiles
     
     return atlas
 
 
+def resolve_tile_path(atlas: Atlas, base_tile: BaseTile) -> Path:
+    """
+    Get the path of a base tile's image, extracting it from the atlas
+    archive into the cache directory on first access.
+    
+    Args:
+        atlas: The atlas the tile belongs to
+        base_tile: The base tile whose image is needed
+        
+    Returns:
+        The tile's source path (may still be relative to the atlas directory)
+    """
+    pending = getattr(atlas, '_pending_tiles', None)
+    if pending and base_tile.source_path in pending:
+        _extract_tiles(atlas, [base_tile.source_path])
+    return Path(base_tile.source_path)
+
+
+def _extract_pending_tiles(atlas: Atlas) -> None:
+    """Extract every tile image that has not been pulled out of the archive yet."""
+    pending = getattr(atlas, '_pending_tiles', None)
+    if pending:
+        _extract_tiles(atlas, list(pending))
+
+
+def _extract_tiles(atlas: Atlas, extracted_paths: list[str]) -> None:
+    """
+    Extract the given pending tiles into the atlas cache directory.
+    Files left in the cache by an earlier session are reused when their size
+    and CRC-32 match the archive member.
+    """
+    extract_dir = Path(atlas._extraction_dir)
+    try:
+        with zipfile.ZipFile(atlas._archive_path, 'r') as zf:
+            for extracted_path in extracted_paths:
+                member = atlas._pending_tiles.pop(extracted_path)
+                cached = Path(extracted_path)
+                if _cache_matches(cached, zf.getinfo(member)):
+                    continue
+                zf.extract(member, extract_dir)
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        print(f"Warning: Could not extract tiles from {atlas._archive_path}: {e}")
+
+
+def _cache_matches(cached: Path, info: zipfile.ZipInfo) -> bool:
+    """Check whether a cached file holds exactly the bytes of an archive member."""
+    try:
+        if cached.stat().st_size != info.file_size:
+            return False
+        return zlib.crc32(cached.read_bytes()) == info.CRC
+    except OSError:
+        return False
+
+
 def cleanup_extraction(atlas: Atlas) -> None:
     """
     Clean up extracted tile files when closing an atlas.
+    Only the first call does any work, later calls return immediately.
     """
     if hasattr(atlas, '_extraction_dir') and atlas._extraction_dir:
         extract_dir = Path(atlas._extraction_dir)
@@ -177,3 +326,6 @@ def cleanup_extraction(atlas: Atlas) -> None:
                 shutil.rmtree(extract_dir)
             except Exception:
                 pass  # Ignore cleanup errors
+        # Nothing is extracted for this atlas any more
+        atlas._extraction_dir = None
+        atlas._pending_tiles = {}
@@ -4,30 +4,56 @@ Provides mappings for how sides change under different transforms.
 """
 
 from typing import Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 Side = Literal['top', 'right', 'bottom', 'left']
 SIDES: list[Side] = ['top', 'right', 'bottom', 'left']
+_SIDE_IDX: dict[str, int] = {side: i for i, side in enumerate(SIDES)}
 
+# The shared Transform instance for each packed code
+_INTERN: dict[int, 'Transform'] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, init=False)
 class Transform:
-    """Represents a tile transformation (rotation + flips)."""
+    """
+    Represents a tile transformation (rotation + flips).
+    Instances are interned: there is exactly one object per distinct transform.
+    """
     rotation: int = 0        # 0, 90, 180, 270 (clockwise)
     flip_x: bool = False     # horizontal flip
     flip_y: bool = False     # vertical flip
+    code: int = field(init=False, repr=False, compare=False)  # packed 0..15 table index
+    
+    def __new__(cls, rotation: int = 0, flip_x: bool = False, flip_y: bool = False) -> 'Transform':
+        if rotation % 90:
+            raise ValueError(f"Invalid rotation: {rotation}. Must be a multiple of 90.")
+        # rotation_idx << 2 | flip_x << 1 | flip_y
+        code = ((rotation % 360) // 90) << 2 | (bool(flip_x) << 1) | bool(flip_y)
+        self = _INTERN.get(code)
+        if self is None:
+            self = super().__new__(cls)
+            object.__setattr__(self, 'rotation', (code >> 2) * 90)
+            object.__setattr__(self, 'flip_x', bool(flip_x))
+            object.__setattr__(self, 'flip_y', bool(flip_y))
+            object.__setattr__(self, 'code', code)
+            _INTERN[code] = self
+        return self
+    
+    def __init__(self, rotation: int = 0, flip_x: bool = False, flip_y: bool = False):
+        pass  # fully initialized in __new__
+    
+    def __hash__(self) -> int:
+        return self.code
+    
+    def __reduce__(self):
+        # Copies and unpickled objects go through __new__ and stay interned
+        return (Transform, (self.rotation, self.flip_x, self.flip_y))
     
     @property
     def suffix(self) -> str:
         """Generate ID suffix for this transform."""
-        parts = []
-        if self.rotation != 0:
-            parts.append(f'r{self.rotation}')
-        if self.flip_x:
-            parts.append('fx')
-        if self.flip_y:
-            parts.append('fy')
-        return '_'.join(parts) if parts else ''
+        return _SUFFIX_TABLE[self.code]
     
     @property
     def is_identity(self) -> bool:
@@ -39,30 +65,14 @@ class Transform:
         Compute which side a given side maps to after this transform.
         Rotation is applied first, then flips.
         """
-        result = side
-        
-        # Apply rotation (clockwise)
-        if self.rotation != 0:
-            result = rotate_side(result, self.rotation)
-        
-        # Apply flips
-        if self.flip_x:
-            result = flip_side(result, 'x')
-        if self.flip_y:
-            result = flip_side(result, 'y')
-        
-        return result
+        return SIDES[_APPLY_SIDE[(self.code << 2) | _SIDE_IDX[side]]]
     
     def inverse_side(self, side: Side) -> Side:
         """
         Compute which original side maps TO the given side after this transform.
         This is the inverse of apply_to_side.
         """
-        # We need to find which original side becomes 'side' after transform
-        for original_side in SIDES:
-            if self.apply_to_side(original_side) == side:
-                return original_side
-        raise ValueError(f"Could not find inverse for side {side}")
+        return SIDES[_INV_APPLY_SIDE[(self.code << 2) | _SIDE_IDX[side]]]
     
     def inverse(self) -> 'Transform':
         """
@@ -70,44 +80,7 @@ class Transform:
         If T transforms A to B, then T.inverse() transforms B to A.
         Result is normalized to use only flip_x.
         """
-        # Transform applies: rotate, then flip_x, then flip_y
-        # Inverse must undo in reverse order: undo flip_y, undo flip_x, undo rotate
-        # Flips are self-inverse
-        # Rotation inverse: inv(r) = (360 - r) % 360
-        
-        # But we need to express this as a new Transform(rotation, flip_x, flip_y)
-        # which applies in the ORDER: rotate, flip_x, flip_y
-        
-        # The inverse of (rotate r, flip_x fx, flip_y fy) is:
-        # (flip_y fy, flip_x fx, rotate -r)  (operations in reverse order)
-        
-        # We need to commute flips past rotation to get standard form
-        # flip_y then rotate(-r) = rotate(-r) then flip_?
-        # flip_x then rotate(-r) = rotate(-r) then flip_?
-        
-        # When rotating, flip_x and flip_y swap axes:
-        # flip_x followed by rotate(90) = rotate(90) followed by flip_y
-        # flip_y followed by rotate(90) = rotate(90) followed by flip_x
-        # flip_x followed by rotate(180) = rotate(180) followed by flip_x
-        # flip_y followed by rotate(180) = rotate(180) followed by flip_y
-        # flip_x followed by rotate(270) = rotate(270) followed by flip_y
-        # flip_y followed by rotate(270) = rotate(270) followed by flip_x
-        
-        inv_rotation = (360 - self.rotation) % 360
-        
-        # We have: flip_y, flip_x, rotate(inv_rotation)
-        # Need to move flips after rotation
-        
-        # Move flip_x past rotate(inv_rotation):
-        new_flip_x = self.flip_x
-        new_flip_y = self.flip_y
-        
-        if inv_rotation == 90 or inv_rotation == 270:
-            # flip_x <-> flip_y when passing through 90 or 270 rotation
-            new_flip_x, new_flip_y = self.flip_y, self.flip_x
-        # For 0 and 180, flips stay the same
-        
-        return Transform(inv_rotation, new_flip_x, new_flip_y).normalize()
+        return _INVERSE_TABLE[self.code]
     
     def compose(self, other: 'Transform') -> 'Transform':
         """
@@ -115,41 +88,7 @@ class Transform:
         Returns a new Transform representing the combined effect.
         Result is normalized to use only flip_x (no flip_y).
         """
-        # Apply self first: (r1, fx1, fy1), then other: (r2, fx2, fy2)
-        # Result: rotate(r1), flip_x(fx1), flip_y(fy1), rotate(r2), flip_x(fx2), flip_y(fy2)
-        
-        # We need to combine into: rotate(r), flip_x(fx), flip_y(fy)
-        
-        # Step 1: Move flip_y(fy1) past rotate(r2)
-        # Step 2: Move flip_x(fx1) past rotate(r2)
-        # Then combine the flips and rotations
-        
-        # When flip passes through rotation:
-        # - flip_x past r90 -> flip_y
-        # - flip_y past r90 -> flip_x
-        # - flip_x past r180 -> flip_x
-        # - flip_y past r180 -> flip_y
-        # - flip_x past r270 -> flip_y
-        # - flip_y past r270 -> flip_x
-        
-        # Transform the flips through other's rotation
-        fx1, fy1 = self.flip_x, self.flip_y
-        
-        if other.rotation == 90 or other.rotation == 270:
-            # Swap flip axes
-            fx1, fy1 = fy1, fx1
-        
-        # Now we have: rotate(r1), rotate(r2), flip_x(fx1), flip_y(fy1), flip_x(fx2), flip_y(fy2)
-        # Combine rotations: r = (r1 + r2) % 360
-        # Combine flips: flip_x = fx1 XOR fx2, flip_y = fy1 XOR fy2
-        
-        new_rotation = (self.rotation + other.rotation) % 360
-        new_flip_x = fx1 != other.flip_x  # XOR
-        new_flip_y = fy1 != other.flip_y  # XOR
-        
-        # Normalize: convert flip_y to r180 + flip_x
-        # This ensures we only use variants that exist (_fx, not _fy)
-        return Transform(new_rotation, new_flip_x, new_flip_y).normalize()
+        return _COMPOSE_TABLE[(self.code << 4) | other.code]
     
     def normalize(self) -> 'Transform':
         """
@@ -161,23 +100,7 @@ class Transform:
         
         This ensures we match tile variants that only have _fx versions.
         """
-        rotation = self.rotation
-        flip_x = self.flip_x
-        flip_y = self.flip_y
-        
-        if flip_y:
-            if flip_x:
-                # flip_x + flip_y = r180
-                rotation = (rotation + 180) % 360
-                flip_x = False
-                flip_y = False
-            else:
-                # flip_y alone = r180 + flip_x
-                rotation = (rotation + 180) % 360
-                flip_x = True
-                flip_y = False
-        
-        return Transform(rotation, flip_x, flip_y)
+        return _NORMALIZE_TABLE[self.code]
 
 
 # --- Side Rotation ---
@@ -201,53 +124,153 @@ def rotate_side(side: Side, degrees: int) -> Side:
 
 # --- Side Flipping ---
 
-_FLIP_X_MAP = {'top': 'top', 'right': 'left', 'bottom': 'bottom', 'left': 'right'}
-_FLIP_Y_MAP = {'top': 'bottom', 'right': 'right', 'bottom': 'top', 'left': 'left'}
-
+# With sides indexed clockwise from top (0..3), the opposite side is idx ^ 2.
+# A horizontal flip swaps only right/left (odd indices), a vertical flip only
+# top/bottom (even indices).
 
 def flip_side(side: Side, axis: Literal['x', 'y']) -> Side:
     """Get the new position of a side after flipping on an axis."""
+    idx = _SIDE_IDX[side]
     if axis == 'x':
-        return _FLIP_X_MAP[side]
+        return SIDES[idx ^ ((idx & 1) << 1)]
     elif axis == 'y':
-        return _FLIP_Y_MAP[side]
+        return SIDES[idx ^ ((~idx & 1) << 1)]
     raise ValueError(f"Invalid axis: {axis}. Must be 'x' or 'y'.")
 
 
 def get_opposite_side(side: Side) -> Side:
     """Get the opposite side (top<->bottom, left<->right)."""
-    opposites = {'top': 'bottom', 'bottom': 'top', 'left': 'right', 'right': 'left'}
-    return opposites[side]
+    return SIDES[_SIDE_IDX[side] ^ 2]
 
 
 # --- All Transform Combinations ---
 
-def get_all_transforms(include_identity: bool = True) -> list[Transform]:
+def get_all_transforms(include_identity: bool = True) -> tuple[Transform, ...]:
     """
     Get all unique transform combinations.
     Note: Some combinations are equivalent (e.g., r180 = fx + fy).
-    This returns all 8 combinations for simplicity.
+    This returns all 16 combinations for simplicity.
     """
-    transforms = []
-    for rotation in [0, 90, 180, 270]:
-        for flip_x in [False, True]:
-            for flip_y in [False, True]:
-                t = Transform(rotation, flip_x, flip_y)
-                if include_identity or not t.is_identity:
-                    transforms.append(t)
-    return transforms
+    return _TRANSFORMS if include_identity else _TRANSFORMS[1:]
 
 
-def get_rotation_transforms() -> list[Transform]:
+def get_rotation_transforms() -> tuple[Transform, ...]:
     """Get just the rotation transforms (no flips)."""
-    return [Transform(r, False, False) for r in [0, 90, 180, 270]]
+    return _ROTATION_TRANSFORMS
 
 
-def get_flip_transforms() -> list[Transform]:
+def get_flip_transforms() -> tuple[Transform, ...]:
     """Get just the flip transforms (no rotation)."""
-    return [
-        Transform(0, False, False),  # identity
-        Transform(0, True, False),   # flip x
-        Transform(0, False, True),   # flip y
-        Transform(0, True, True),    # flip both
-    ]
+    return _FLIP_TRANSFORMS
+
+
+# --- Precomputed Transform Tables ---
+
+# A transform packs into a 4-bit code: rotation_idx << 2 | flip_x << 1 | flip_y, where
+# rotation_idx = rotation // 90. Compose/inverse/normalize are branchless bit arithmetic
+# on codes, evaluated once here for every input and looked up by Transform.code afterwards.
+
+def _suffix_code(code: int) -> str:
+    """Transform.suffix on a packed code."""
+    parts = []
+    if code >> 2:
+        parts.append(f'r{(code >> 2) * 90}')
+    if code & 2:
+        parts.append('fx')
+    if code & 1:
+        parts.append('fy')
+    return '_'.join(parts)
+
+
+def _normalize_code(code: int) -> int:
+    """Transform.normalize on a packed code."""
+    # flip_y alone = r180 + flip_x, flip_x + flip_y = r180:
+    # fold flip_y into two quarter turns and toggle flip_x
+    fy = code & 1
+    rotation = ((code >> 2) + (fy << 1)) & 3
+    fx = ((code >> 1) & 1) ^ fy
+    return (rotation << 2) | (fx << 1)
+
+
+def _inverse_code(code: int) -> int:
+    """Transform.inverse on a packed code."""
+    # The inverse of (rotate r, flip_x fx, flip_y fy) is (flip_y fy, flip_x fx, rotate -r).
+    # Flips are self-inverse; commuting them past rotate(-r) back into standard order
+    # swaps their axes when -r is 90 or 270 (odd rotation_idx).
+    rotation = -(code >> 2) & 3
+    fx, fy = (code >> 1) & 1, code & 1
+    swap = (fx ^ fy) & rotation & 1
+    fx ^= swap
+    fy ^= swap
+    return _normalize_code((rotation << 2) | (fx << 1) | fy)
+
+
+def _compose_code(first: int, second: int) -> int:
+    """Transform.compose (first followed by second) on packed codes."""
+    # Result: rotate(r1), flip_x(fx1), flip_y(fy1), rotate(r2), flip_x(fx2), flip_y(fy2)
+    # Move the first flips past rotate(r2) (axes swap iff r2 is 90 or 270), then
+    # combine rotations by addition and flips by XOR.
+    r2 = second >> 2
+    fx, fy = (first >> 1) & 1, first & 1
+    swap = (fx ^ fy) & r2 & 1
+    fx ^= swap ^ ((second >> 1) & 1)
+    fy ^= swap ^ (second & 1)
+    rotation = ((first >> 2) + r2) & 3
+    
+    # Normalize: convert flip_y to r180 + flip_x
+    # This ensures we only use variants that exist (_fx, not _fy)
+    return _normalize_code((rotation << 2) | (fx << 1) | fy)
+
+
+# One shared instance per code, ordered so that _TRANSFORMS[t.code] == t
+_TRANSFORMS: tuple[Transform, ...] = tuple(
+    Transform((code >> 2) * 90, bool(code & 2), bool(code & 1)) for code in range(16)
+)
+_ROTATION_TRANSFORMS: tuple[Transform, ...] = _TRANSFORMS[::4]
+# identity, flip x, flip y, flip both
+_FLIP_TRANSFORMS: tuple[Transform, ...] = tuple(_TRANSFORMS[code] for code in (0, 2, 1, 3))
+
+
+def _apply_to_side_slow(transform: Transform, side: Side) -> Side:
+    """Reference implementation of Transform.apply_to_side."""
+    result = side
+    
+    # Apply rotation (clockwise)
+    if transform.rotation != 0:
+        result = rotate_side(result, transform.rotation)
+    
+    # Apply flips
+    if transform.flip_x:
+        result = flip_side(result, 'x')
+    if transform.flip_y:
+        result = flip_side(result, 'y')
+    
+    return result
+
+
+_SUFFIX_TABLE: tuple[str, ...] = tuple(_suffix_code(code) for code in range(16))
+_NORMALIZE_TABLE: tuple[Transform, ...] = tuple(
+    _TRANSFORMS[_normalize_code(code)] for code in range(16)
+)
+_INVERSE_TABLE: tuple[Transform, ...] = tuple(
+    _TRANSFORMS[_inverse_code(code)] for code in range(16)
+)
+# Indexed by (first.code << 4) | second.code
+_COMPOSE_TABLE: tuple[Transform, ...] = tuple(
+    _TRANSFORMS[_compose_code(a, b)] for a in range(16) for b in range(16)
+)
+# Indexed by (code << 2) | side_idx, value is the resulting side_idx
+_APPLY_SIDE: tuple[int, ...] = tuple(
+    _SIDE_IDX[_apply_to_side_slow(t, side)] for t in _TRANSFORMS for side in SIDES
+)
+# Inverse of _APPLY_SIDE: which original side_idx lands on side_idx after the transform
+_INV_APPLY_SIDE: tuple[int, ...] = tuple(
+    _APPLY_SIDE[t.code << 2:(t.code << 2) + 4].index(side_idx)
+    for t in _TRANSFORMS for side_idx in range(4)
+)
+# Indexed by (from_code << 6) | (to_code << 2) | side_idx: the side_idx in to's frame that
+# corresponds to side_idx in from's frame (both transforms relative to the base tile)
+_SIDE_BETWEEN: tuple[int, ...] = tuple(
+    _APPLY_SIDE[(to_code << 2) | _INV_APPLY_SIDE[(from_code << 2) | side_idx]]
+    for from_code in range(16) for to_code in range(16) for side_idx in range(4)
+)
@@ -80,14 +80,16 @@ def validate_atlas(atlas: 'Atlas', enabled_only: bool = True) -> ValidationResul
     """
     result = ValidationResult()
     
-    # Get tiles to validate
-    tiles_to_check = [t for t in atlas.tiles if not enabled_only or t.enabled]
-    
-    for tile in tiles_to_check:
+    for tile in atlas.tiles:
+        # Filter while iterating rather than copying the tile list
+        if enabled_only and not tile.enabled:
+            continue
+        
         tile_result = TileValidation(tile_id=tile.id)
         has_any_rules = False
         
         for side in SIDES:
+            # Indexed lookup on the atlas, no scan over all rules
             rules = atlas.get_rules_for_tile(tile.id, side)
             
             if not rules:
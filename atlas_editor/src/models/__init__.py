@@ -1,8 +1,8 @@
 from .base_tile import BaseTile
-from .tile import Tile
-from .rule import AdjacencyRule
+from .tile import Tile, parse_variant_id
+from .rule import AdjacencyRule, Side
 from .settings import Settings
 from .atlas import Atlas
 
-__all__ = ['BaseTile', 'Tile', 'AdjacencyRule', 'Settings', 'Atlas']
+__all__ = ['BaseTile', 'Tile', 'parse_variant_id', 'AdjacencyRule', 'Side', 'Settings', 'Atlas']
 
@@ -1,5 +1,6 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, Iterator
+from typing import Optional, Iterator, Iterable, Union
 from .base_tile import BaseTile
 from .tile import Tile
 from .rule import AdjacencyRule, Side
@@ -21,89 +22,200 @@ class Atlas:
     file_path: Optional[str] = field(default=None, repr=False)
     modified: bool = field(default=False, repr=False)
     
+    # Lookup indexes, kept in sync with the lists above by the methods below.
+    # Where ids collide, the by-id indexes hold the first entry, like a list scan would.
+    _base_by_id: dict[str, BaseTile] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _tile_by_id: dict[str, Tile] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _tiles_by_base: dict[str, list[Tile]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Dense position of each distinct tile id, in tile list order
+    _tile_index: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _rule_by_key: dict[tuple[str, Side, str], AdjacencyRule] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _rules_by_tile_side: dict[tuple[str, Side], list[AdjacencyRule]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _rules_by_neighbor: dict[str, list[AdjacencyRule]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Cached result of build_compat_masks, reset whenever tiles or rules change
+    _compat_masks: Optional[tuple[dict[str, int], list[list[int]]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._base_by_id = {}
+        for bt in self.base_tiles:
+            self._base_by_id.setdefault(bt.id, bt)
+        self._rebuild_tile_index()
+        self._rebuild_rule_index()
+    
+    def _rebuild_tile_index(self) -> None:
+        self._tile_by_id = {}
+        self._tiles_by_base = {}
+        self._tile_index = {}
+        for t in self.tiles:
+            self._tile_by_id.setdefault(t.id, t)
+            self._tiles_by_base.setdefault(t.base_tile_id, []).append(t)
+            self._tile_index.setdefault(t.id, len(self._tile_index))
+    
+    def _rebuild_rule_index(self) -> None:
+        self._rule_by_key = {}
+        self._rules_by_tile_side = {}
+        self._rules_by_neighbor = {}
+        for r in self.rules:
+            self._rule_by_key.setdefault((r.tile_id, r.side, r.neighbor_id), r)
+            self._rules_by_tile_side.setdefault((r.tile_id, r.side), []).append(r)
+            self._rules_by_neighbor.setdefault(r.neighbor_id, []).append(r)
+    
+    def _remove_rules_for_tiles(self, tile_ids: set[str]) -> bool:
+        """
+        Remove every rule on or pointing at the given tiles, found through the indexes.
+        Returns True if any rule was removed.
+        """
+        removed: dict[int, AdjacencyRule] = {}
+        for tile_id in tile_ids:
+            for side in Side:
+                for r in self._rules_by_tile_side.pop((tile_id, side), ()):
+                    removed[id(r)] = r
+            for r in self._rules_by_neighbor.pop(tile_id, ()):
+                removed[id(r)] = r
+        if not removed:
+            return False
+        
+        # Drop the removed rules from index entries of the tiles that remain
+        buckets = set()
+        neighbors = set()
+        for r in removed.values():
+            self._rule_by_key.pop((r.tile_id, r.side, r.neighbor_id), None)
+            if r.tile_id not in tile_ids:
+                buckets.add((r.tile_id, r.side))
+            if r.neighbor_id not in tile_ids:
+                neighbors.add(r.neighbor_id)
+        for key in buckets:
+            self._rules_by_tile_side[key] = [
+                r for r in self._rules_by_tile_side[key] if id(r) not in removed]
+        for neighbor_id in neighbors:
+            self._rules_by_neighbor[neighbor_id] = [
+                r for r in self._rules_by_neighbor[neighbor_id] if id(r) not in removed]
+        self.rules = [r for r in self.rules if id(r) not in removed]
+        return True
+    
     # --- Base Tile Operations ---
     
     def add_base_tile(self, base_tile: BaseTile) -> None:
         """Add a base tile and create its original (untransformed) Tile."""
-        if self.get_base_tile(base_tile.id):
+        if self.get_base_tile(base_tile.id) is not None:
             raise ValueError(f"Base tile '{base_tile.id}' already exists")
+        # Ids are interned so comparing them is mostly a pointer check
+        base_tile.id = sys.intern(base_tile.id)
         self.base_tiles.append(base_tile)
+        self._base_by_id[base_tile.id] = base_tile
         # Create the original tile variant
         original_tile = Tile.from_base(base_tile.id)
         self.tiles.append(original_tile)
+        self._tile_by_id.setdefault(original_tile.id, original_tile)
+        self._tiles_by_base.setdefault(base_tile.id, []).append(original_tile)
+        self._tile_index.setdefault(original_tile.id, len(self._tile_index))
+        self._compat_masks = None
         self.modified = True
     
     def get_base_tile(self, base_id: str) -> Optional[BaseTile]:
         """Get a base tile by ID."""
-        for bt in self.base_tiles:
-            if bt.id == base_id:
-                return bt
-        return None
+        return self._base_by_id.get(base_id)
     
     def remove_base_tile(self, base_id: str) -> None:
         """Remove a base tile and all its variants and rules."""
+        if base_id not in self._base_by_id and base_id not in self._tiles_by_base:
+            return  # Nothing to remove
         # Remove base tile
         self.base_tiles = [bt for bt in self.base_tiles if bt.id != base_id]
+        self._base_by_id.pop(base_id, None)
         # Remove all tile variants
-        tile_ids_to_remove = {t.id for t in self.tiles if t.base_tile_id == base_id}
+        tile_ids_to_remove = {t.id for t in self._tiles_by_base.get(base_id, ())}
         self.tiles = [t for t in self.tiles if t.base_tile_id != base_id]
+        self._rebuild_tile_index()
         # Remove all rules involving those tiles
-        self.rules = [r for r in self.rules 
-                      if r.tile_id not in tile_ids_to_remove 
-                      and r.neighbor_id not in tile_ids_to_remove]
+        self._remove_rules_for_tiles(tile_ids_to_remove)
+        self._compat_masks = None
         self.modified = True
     
     # --- Tile Operations ---
     
     def get_tile(self, tile_id: str) -> Optional[Tile]:
         """Get a tile by ID."""
-        for t in self.tiles:
-            if t.id == tile_id:
-                return t
-        return None
+        return self._tile_by_id.get(tile_id)
+    
+    def tile_index_of(self, tile_id: str) -> int:
+        """
+        Get the dense index of a tile, or -1 if there is no such tile.
+        
+        Indexes follow tile list order and match the bit positions used by
+        build_compat_masks. Removing a tile shifts the indexes after it.
+        """
+        return self._tile_index.get(tile_id, -1)
     
     def get_tiles_for_base(self, base_id: str) -> list[Tile]:
         """Get all tile variants for a base tile."""
-        return [t for t in self.tiles if t.base_tile_id == base_id]
+        return list(self._tiles_by_base.get(base_id, ()))
     
     def add_tile_variant(self, base_id: str, rotation: int = 0, 
                          flip_x: bool = False, flip_y: bool = False) -> Tile:
         """Add a transformed variant of a base tile."""
         tile_id = Tile.create_id(base_id, rotation, flip_x, flip_y)
         existing = self.get_tile(tile_id)
-        if existing:
+        if existing is not None:
             return existing  # Already exists, return it
         
         tile = Tile.from_base(base_id, rotation, flip_x, flip_y)
         self.tiles.append(tile)
+        self._tile_by_id[tile_id] = tile
+        self._tiles_by_base.setdefault(base_id, []).append(tile)
+        self._tile_index[tile_id] = len(self._tile_index)
+        self._compat_masks = None
         self.modified = True
         return tile
     
     def remove_tile(self, tile_id: str) -> None:
         """Remove a tile variant (cannot remove original)."""
         tile = self.get_tile(tile_id)
-        if tile and tile.is_original:
+        if tile is not None and tile.is_original:
             raise ValueError("Cannot remove original tile variant. Remove the base tile instead.")
-        self.tiles = [t for t in self.tiles if t.id != tile_id]
+        if tile is not None:
+            self.tiles = [t for t in self.tiles if t.id != tile_id]
+            self._tile_by_id.pop(tile_id, None)
+            self._tiles_by_base[tile.base_tile_id] = [
+                t for t in self._tiles_by_base.get(tile.base_tile_id, ()) if t.id != tile_id]
+            # Later tiles move down one position
+            self._tile_index = {}
+            for t in self.tiles:
+                self._tile_index.setdefault(t.id, len(self._tile_index))
         # Remove rules involving this tile
-        self.rules = [r for r in self.rules 
-                      if r.tile_id != tile_id and r.neighbor_id != tile_id]
+        if not self._remove_rules_for_tiles({tile_id}) and tile is None:
+            return  # Nothing changed
+        self._compat_masks = None
         self.modified = True
     
     # --- Rule Operations ---
     
-    def add_rule(self, tile_id: str, side: Side, neighbor_id: str, 
+    # Rule methods take a Side, its index, or its name ('top', ...)
+    
+    def add_rule(self, tile_id: str, side: Union[Side, str], neighbor_id: str, 
                  weight: float = 100.0, auto_generated: bool = False) -> AdjacencyRule:
         """Add or update an adjacency rule."""
+        side = Side.coerce(side)
         # Check if rule already exists
-        for rule in self.rules:
-            if rule.tile_id == tile_id and rule.side == side and rule.neighbor_id == neighbor_id:
+        rule = self._rule_by_key.get((tile_id, side, neighbor_id))
+        if rule is not None:
+            if rule.weight != weight or rule.auto_generated != auto_generated:
                 rule.weight = weight
                 rule.auto_generated = auto_generated
                 self.modified = True
-                return rule
+            return rule
         
         # Create new rule
+        tile_id = sys.intern(tile_id)
+        neighbor_id = sys.intern(neighbor_id)
         rule = AdjacencyRule(
             tile_id=tile_id,
             side=side,
@@ -112,28 +224,115 @@ class Atlas:
             auto_generated=auto_generated
         )
         self.rules.append(rule)
+        self._rule_by_key[(tile_id, side, neighbor_id)] = rule
+        self._rules_by_tile_side.setdefault((tile_id, side), []).append(rule)
+        self._rules_by_neighbor.setdefault(neighbor_id, []).append(rule)
+        self._compat_masks = None
         self.modified = True
         return rule
     
-    def get_rules_for_tile(self, tile_id: str, side: Optional[Side] = None) -> list[AdjacencyRule]:
+    def bulk_add_rules(self, rules: Iterable[tuple[str, Union[Side, str], str, float, bool]]) -> list[AdjacencyRule]:
+        """
+        Add or update many adjacency rules in one call.
+        
+        Takes (tile_id, side, neighbor_id, weight, auto_generated) tuples, consumed
+        in order, with the same result as calling add_rule for each. Returns the
+        added or updated rules in input order.
+        """
+        result = []
+        new_rules = []
+        updated = False
+        rule_by_key = self._rule_by_key
+        for tile_id, side, neighbor_id, weight, auto_generated in rules:
+            side = Side.coerce(side)
+            rule = rule_by_key.get((tile_id, side, neighbor_id))
+            if rule is not None:
+                if rule.weight != weight or rule.auto_generated != auto_generated:
+                    rule.weight = weight
+                    rule.auto_generated = auto_generated
+                    updated = True
+            else:
+                tile_id = sys.intern(tile_id)
+                neighbor_id = sys.intern(neighbor_id)
+                rule = AdjacencyRule(tile_id, side, neighbor_id, weight, auto_generated)
+                rule_by_key[(tile_id, side, neighbor_id)] = rule
+                self._rules_by_tile_side.setdefault((tile_id, side), []).append(rule)
+                self._rules_by_neighbor.setdefault(neighbor_id, []).append(rule)
+                new_rules.append(rule)
+            result.append(rule)
+        
+        if new_rules:
+            self.rules.extend(new_rules)
+            self._compat_masks = None
+        if new_rules or updated:
+            self.modified = True
+        return result
+    
+    def get_rules_for_tile(self, tile_id: str, side: Optional[Union[Side, str]] = None) -> list[AdjacencyRule]:
         """Get all rules for a tile, optionally filtered by side."""
-        rules = [r for r in self.rules if r.tile_id == tile_id]
-        if side:
-            rules = [r for r in rules if r.side == side]
-        return rules
+        if side is not None:
+            return list(self._rules_by_tile_side.get((tile_id, Side.coerce(side)), ()))
+        return [r for r in self.rules if r.tile_id == tile_id]
+    
+    def get_rules_by_side(self, tile_id: str) -> dict[Side, list[AdjacencyRule]]:
+        """Get all rules for a tile grouped by side, with an entry for every side."""
+        return {side: list(self._rules_by_tile_side.get((tile_id, side), ())) for side in Side}
     
-    def get_rule(self, tile_id: str, side: Side, neighbor_id: str) -> Optional[AdjacencyRule]:
+    def get_rule(self, tile_id: str, side: Union[Side, str], neighbor_id: str) -> Optional[AdjacencyRule]:
         """Get a specific rule."""
-        for rule in self.rules:
-            if rule.tile_id == tile_id and rule.side == side and rule.neighbor_id == neighbor_id:
-                return rule
-        return None
+        return self._rule_by_key.get((tile_id, Side.coerce(side), neighbor_id))
     
-    def remove_rule(self, tile_id: str, side: Side, neighbor_id: str) -> None:
+    def remove_rule(self, tile_id: str, side: Union[Side, str], neighbor_id: str) -> None:
         """Remove a specific rule."""
-        self.rules = [r for r in self.rules 
-                      if not (r.tile_id == tile_id and r.side == side and r.neighbor_id == neighbor_id)]
+        side = Side.coerce(side)
+        # The rule (and any duplicates of its key) sits in its side bucket
+        side_rules = self._rules_by_tile_side.get((tile_id, side), ())
+        removed = {id(r) for r in side_rules if r.neighbor_id == neighbor_id}
+        if not removed:
+            return  # No such rule
+        self.rules = [r for r in self.rules if id(r) not in removed]
+        self._rule_by_key.pop((tile_id, side, neighbor_id), None)
+        side_rules[:] = [r for r in side_rules if id(r) not in removed]
+        self._rules_by_neighbor[neighbor_id] = [
+            r for r in self._rules_by_neighbor[neighbor_id] if id(r) not in removed]
+        self._compat_masks = None
+        self.modified = True
+    
+    def replace_rule(self, tile_id: str, side: Union[Side, str], old_neighbor_id: str,
+                     new_neighbor_id: str) -> Optional[AdjacencyRule]:
+        """
+        Point a rule at another neighbor, keeping its weight, flag and position.
+        
+        Same result as remove_rule followed by add_rule with the old weight: if
+        the new neighbor already has a rule, that one takes over the weight.
+        Returns the resulting rule, or None if there is no rule to replace.
+        """
+        side = Side.coerce(side)
+        rule = self._rule_by_key.get((tile_id, side, old_neighbor_id))
+        if rule is None or old_neighbor_id == new_neighbor_id:
+            return rule
+        if (tile_id, side, new_neighbor_id) in self._rule_by_key:
+            weight, auto_generated = rule.weight, rule.auto_generated
+            self.remove_rule(tile_id, side, old_neighbor_id)
+            return self.add_rule(tile_id, side, new_neighbor_id, weight, auto_generated)
+        
+        # Duplicates of the old key are dropped, as remove_rule would
+        side_rules = self._rules_by_tile_side[(tile_id, side)]
+        dropped = {id(r) for r in side_rules if r.neighbor_id == old_neighbor_id and r is not rule}
+        if dropped:
+            self.rules = [r for r in self.rules if id(r) not in dropped]
+            side_rules[:] = [r for r in side_rules if id(r) not in dropped]
+        dropped.add(id(rule))
+        self._rule_by_key.pop((tile_id, side, old_neighbor_id))
+        self._rules_by_neighbor[old_neighbor_id] = [
+            r for r in self._rules_by_neighbor[old_neighbor_id] if id(r) not in dropped]
+        
+        rule.neighbor_id = sys.intern(new_neighbor_id)
+        self._rule_by_key[(tile_id, side, rule.neighbor_id)] = rule
+        self._rules_by_neighbor.setdefault(rule.neighbor_id, []).append(rule)
+        self._compat_masks = None
         self.modified = True
+        return rule
     
     def remove_auto_rules(self) -> int:
         """Remove all auto-generated rules. Returns count removed."""
@@ -141,18 +340,46 @@ class Atlas:
         self.rules = [r for r in self.rules if not r.auto_generated]
         removed = original_count - len(self.rules)
         if removed > 0:
+            self._rebuild_rule_index()
+            self._compat_masks = None
             self.modified = True
         return removed
     
+    # --- Compatibility Masks ---
+    
+    def build_compat_masks(self) -> tuple[dict[str, int], list[list[int]]]:
+        """
+        Get the adjacency rules as neighbor bitmasks.
+        
+        Returns (tile_index, masks): tile_index maps each tile id to a bit
+        position (the same one tile_index_of returns), and masks[side][tile_index[t]] has bit tile_index[n] set for
+        every neighbor n allowed on that side of tile t. Allowed sets can then
+        be combined with | and & instead of scanning rules.
+        The result is cached until the next tile or rule change.
+        """
+        if self._compat_masks is None:
+            tile_index = dict(self._tile_index)
+            masks = [[0] * len(tile_index) for _ in Side]
+            for r in self.rules:
+                t = tile_index.get(r.tile_id)
+                n = tile_index.get(r.neighbor_id)
+                if t is not None and n is not None:
+                    masks[r.side][t] |= 1 << n
+            self._compat_masks = (tile_index, masks)
+        return self._compat_masks
+    
     # --- Serialization ---
     
+    # map() with the plain functions avoids a method lookup per element,
+    # which adds up on large rule lists
+    
     def to_dict(self) -> dict:
         return {
             'version': self.version,
             'settings': self.settings.to_dict(),
-            'base_tiles': [bt.to_dict() for bt in self.base_tiles],
-            'tiles': [t.to_dict() for t in self.tiles],
-            'rules': [r.to_dict() for r in self.rules]
+            'base_tiles': list(map(BaseTile.to_dict, self.base_tiles)),
+            'tiles': list(map(Tile.to_dict, self.tiles)),
+            'rules': list(map(AdjacencyRule.to_dict, self.rules))
         }
     
     @classmethod
@@ -160,8 +387,8 @@ class Atlas:
         return cls(
             version=data.get('version', '1.0'),
             settings=Settings.from_dict(data.get('settings', {})),
-            base_tiles=[BaseTile.from_dict(bt) for bt in data.get('base_tiles', [])],
-            tiles=[Tile.from_dict(t) for t in data.get('tiles', [])],
-            rules=[AdjacencyRule.from_dict(r) for r in data.get('rules', [])]
+            base_tiles=list(map(BaseTile.from_dict, data.get('base_tiles', []))),
+            tiles=list(map(Tile.from_dict, data.get('tiles', []))),
+            rules=list(map(AdjacencyRule.from_dict, data.get('rules', [])))
         )
 
@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BaseTile:
     """
     Represents an original imported tile image.
@@ -24,7 +25,7 @@ class BaseTile:
     @classmethod
     def from_dict(cls, data: dict) -> 'BaseTile':
         return cls(
-            id=data['id'],
+            id=sys.intern(data['id']),
             source_path=data['source'],
             width=data.get('width', 0),
             height=data.get('height', 0)
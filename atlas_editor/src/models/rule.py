@@ -1,21 +1,50 @@
+import sys
 from dataclasses import dataclass
-from typing import Literal
+from enum import IntEnum
+from typing import Union
 
-Side = Literal['top', 'right', 'bottom', 'left']
 
+class Side(IntEnum):
+    """Side of a tile, numbered clockwise from the top."""
+    TOP = 0
+    RIGHT = 1
+    BOTTOM = 2
+    LEFT = 3
+    
+    @classmethod
+    def coerce(cls, side: Union['Side', int, str]) -> 'Side':
+        """Get the Side for a Side, its index, or its name ('top', 'right', ...)."""
+        try:
+            return _SIDE_LOOKUP[side]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid side: {side!r}") from None
+
+
+# Serialized names, indexed by Side
+SIDE_NAMES: tuple[str, ...] = ('top', 'right', 'bottom', 'left')
 
-@dataclass
+# Members keyed by name and by index (a Side hashes like its int value)
+_SIDE_LOOKUP: dict[Union[int, str], Side] = {
+    **{name: Side(i) for i, name in enumerate(SIDE_NAMES)},
+    **{int(s): s for s in Side},
+}
+
+
+@dataclass(slots=True, eq=False)
 class AdjacencyRule:
     """
     Represents an adjacency rule: which tile can be placed next to another tile on a specific side.
     Weight is stored as a percentage (0-100). All weights for a given tile+side should sum to 100.
     """
     tile_id: str                      # the tile this rule belongs to
-    side: Side                        # which side of the tile
+    side: Side                        # which side of the tile (names are accepted and converted)
     neighbor_id: str                  # which tile can be adjacent on that side
     weight: float = 100.0             # percentage weight (0-100)
     auto_generated: bool = False      # True if created by auto-propagation
     
+    def __post_init__(self):
+        self.side = Side.coerce(self.side)
+    
     @property
     def key(self) -> tuple:
         """Unique key for this rule (tile_id, side, neighbor_id)."""
@@ -24,7 +53,7 @@ class AdjacencyRule:
     def to_dict(self) -> dict:
         return {
             'tile': self.tile_id,
-            'side': self.side,
+            'side': SIDE_NAMES[self.side],
             'neighbor': self.neighbor_id,
             'weight': self.weight,
             'auto': self.auto_generated
@@ -33,9 +62,9 @@ class AdjacencyRule:
     @classmethod
     def from_dict(cls, data: dict) -> 'AdjacencyRule':
         return cls(
-            tile_id=data['tile'],
+            tile_id=sys.intern(data['tile']),
             side=data['side'],
-            neighbor_id=data['neighbor'],
+            neighbor_id=sys.intern(data['neighbor']),
             weight=data.get('weight', 100.0),
             auto_generated=data.get('auto', False)
         )
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Editor settings that control auto-propagation behavior.
+    Immutable: replace atlas.settings to change them.
     """
     auto_propagate_rotations: bool = True    # auto-generate rules for rotated variants
     auto_propagate_mirrors: bool = True      # auto-generate rules for flipped variants
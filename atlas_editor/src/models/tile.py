@@ -1,8 +1,63 @@
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+def _build_suffix(rotation: int, flip_x: bool, flip_y: bool) -> str:
+    """Build the id suffix for a transform (e.g., '_r90_fx', '' for none)."""
+    parts = []
+    if rotation != 0:
+        parts.append(f'r{rotation}')
+    if flip_x:
+        parts.append('fx')
+    if flip_y:
+        parts.append('fy')
+    return '_' + '_'.join(parts) if parts else ''
+
+
+# Suffixes for the 16 standard transforms; anything else is built on demand
+_SUFFIX_TABLE: dict[tuple[int, bool, bool], str] = {
+    (rotation, flip_x, flip_y): _build_suffix(rotation, flip_x, flip_y)
+    for rotation in (0, 90, 180, 270)
+    for flip_x in (False, True)
+    for flip_y in (False, True)
+}
+
+
+def _suffix(rotation: int, flip_x: bool, flip_y: bool) -> str:
+    """Look up the id suffix for a transform."""
+    suffix = _SUFFIX_TABLE.get((rotation, flip_x, flip_y))
+    if suffix is None:
+        suffix = _build_suffix(rotation, flip_x, flip_y)
+    return suffix
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_variant_id(tile_id: str) -> tuple[str, int, bool, bool]:
+    """
+    Split a tile id into (base_id, rotation, flip_x, flip_y), the reverse of
+    the id suffix. Only trailing transform parts are taken, so base ids may
+    contain underscores.
+    """
+    parts = tile_id.split('_')
+    rotation, flip_x, flip_y = 0, False, False
+    end = len(parts)
+    while end > 1:
+        p = parts[end - 1]
+        if p == 'fy':
+            flip_y = True
+        elif p == 'fx':
+            flip_x = True
+        elif p[:1] == 'r' and p[1:].isdigit():
+            rotation = int(p[1:])
+        else:
+            break
+        end -= 1
+    return '_'.join(parts[:end]), rotation, flip_x, flip_y
+
+
+@dataclass(slots=True, eq=False)
 class Tile:
     """
     Represents a tile variant, which may be the original or a transformed version.
@@ -15,42 +70,36 @@ class Tile:
     flip_y: bool = False              # vertical flip
     enabled: bool = True              # whether to include in WFC export
     
+    # Derived from the transform, which is never changed after creation
+    _is_original: bool = field(init=False, repr=False)
+    _suffix: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self._is_original = self.rotation == 0 and not self.flip_x and not self.flip_y
+        self._suffix = _suffix(self.rotation, self.flip_x, self.flip_y)
+    
     @property
     def is_original(self) -> bool:
         """Returns True if this is the original (no transforms applied)."""
-        return self.rotation == 0 and not self.flip_x and not self.flip_y
+        return self._is_original
     
     @property
     def transform_suffix(self) -> str:
         """Returns the suffix string representing the transform (e.g., '_r90_fx')."""
-        parts = []
-        if self.rotation != 0:
-            parts.append(f'r{self.rotation}')
-        if self.flip_x:
-            parts.append('fx')
-        if self.flip_y:
-            parts.append('fy')
-        return '_' + '_'.join(parts) if parts else ''
+        return self._suffix
     
     @classmethod
     def create_id(cls, base_id: str, rotation: int = 0, flip_x: bool = False, flip_y: bool = False) -> str:
         """Generate a tile ID from base ID and transform parameters."""
-        parts = [base_id]
-        if rotation != 0:
-            parts.append(f'r{rotation}')
-        if flip_x:
-            parts.append('fx')
-        if flip_y:
-            parts.append('fy')
-        return '_'.join(parts)
+        return base_id + _suffix(rotation, flip_x, flip_y)
     
     @classmethod
     def from_base(cls, base_tile_id: str, rotation: int = 0, flip_x: bool = False, flip_y: bool = False) -> 'Tile':
         """Create a Tile from a base tile ID and transform parameters."""
         tile_id = cls.create_id(base_tile_id, rotation, flip_x, flip_y)
         return cls(
-            id=tile_id,
-            base_tile_id=base_tile_id,
+            id=sys.intern(tile_id),
+            base_tile_id=sys.intern(base_tile_id),
             rotation=rotation,
             flip_x=flip_x,
             flip_y=flip_y
@@ -69,8 +118,8 @@ class Tile:
     @classmethod
     def from_dict(cls, data: dict) -> 'Tile':
         return cls(
-            id=data['id'],
-            base_tile_id=data['base'],
+            id=sys.intern(data['id']),
+            base_tile_id=sys.intern(data['base']),
             rotation=data.get('rotation', 0),
             flip_x=data.get('flip_x', False),
             flip_y=data.get('flip_y', False),
@@ -3,13 +3,21 @@ Cross preview panel - standalone widget showing center tile with neighbors.
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QImage, QPainter, QColor, QFont
+from PySide6.QtCore import Qt, Signal, QTimer, QRect
+from PySide6.QtGui import QPixmap, QImage, QPainter, QColor, QFont, QBrush
 from PIL import Image
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from ..core import SIDES
 
+# Position of each side in the per-side index/count lists (same order as SIDES)
+_SIDE_SLOT: Dict[str, int] = {side: i for i, side in enumerate(SIDES)}
+
+
+def _ensure_rgba(image: Image.Image) -> Image.Image:
+    """Tile images are normally RGBA already, and then come back unchanged."""
+    return image if image.mode == 'RGBA' else image.convert('RGBA')
+
 
 class CrossPreviewPanel(QWidget):
     """
@@ -25,19 +33,17 @@ class CrossPreviewPanel(QWidget):
         self._side_images: Dict[str, List[Image.Image]] = {
             'top': [], 'right': [], 'bottom': [], 'left': []
         }
-        self._side_indices: Dict[str, int] = {
-            'top': 0, 'right': 0, 'bottom': 0, 'left': 0
-        }
-        self._side_counts: Dict[str, int] = {
-            'top': 0, 'right': 0, 'bottom': 0, 'left': 0
-        }
+        # Indexed like SIDES
+        self._side_indices: List[int] = [0, 0, 0, 0]
+        self._side_counts: List[int] = [0, 0, 0, 0]
         self._selected_tile_name: str = ""
         
         self._setup_ui()
         
+        # Only runs while the panel is visible and some side has more than one image
         self._cycle_timer = QTimer(self)
+        self._cycle_timer.setInterval(self.CYCLE_INTERVAL)
         self._cycle_timer.timeout.connect(self._auto_cycle)
-        self._cycle_timer.start(self.CYCLE_INTERVAL)
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -74,30 +80,55 @@ class CrossPreviewPanel(QWidget):
             self.title_lbl.setStyleSheet("color: #888; font-size: 12px; font-weight: bold;")
     
     def set_center(self, image: Optional[Image.Image]) -> None:
+        # Converted here, once, so the preview's pixmap conversion can assume RGBA
+        if image is not None:
+            image = _ensure_rgba(image)
         self._center_image = image
         self.preview_widget.set_center(image)
     
     def set_side_images(self, side: str, images: List[Image.Image]) -> None:
         if side in self._side_images:
+            images = [_ensure_rgba(img) for img in images]
             self._side_images[side] = images
-            self._side_counts[side] = len(images)
-            self._side_indices[side] = 0
+            self._side_counts[_SIDE_SLOT[side]] = len(images)
+            self._side_indices[_SIDE_SLOT[side]] = 0
             self.preview_widget.set_side_images(side, images)
+            self._update_cycle_timer()
     
     def clear(self) -> None:
         self._center_image = None
         for side in self._side_images:
             self._side_images[side] = []
-            self._side_indices[side] = 0
-            self._side_counts[side] = 0
+        self._side_indices = [0, 0, 0, 0]
+        self._side_counts = [0, 0, 0, 0]
         self.preview_widget.clear()
         self.set_selected_tile("")
+        self._update_cycle_timer()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_cycle_timer()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._cycle_timer.stop()
+    
+    def _update_cycle_timer(self) -> None:
+        """Run the cycle timer only when there is something visible to cycle."""
+        if self.isVisible() and any(count > 1 for count in self._side_counts):
+            if not self._cycle_timer.isActive():
+                self._cycle_timer.start()
+        else:
+            self._cycle_timer.stop()
     
     def _auto_cycle(self):
+        if not self.isVisible():
+            return
+        indices = self._side_indices
         changed = False
-        for side in SIDES:
-            if self._side_counts[side] > 1:
-                self._side_indices[side] = (self._side_indices[side] + 1) % self._side_counts[side]
+        for i, count in enumerate(self._side_counts):
+            if count > 1:
+                indices[i] = (indices[i] + 1) % count
                 changed = True
         if changed:
             self.preview_widget.set_indices(self._side_indices)
@@ -113,11 +144,42 @@ class CrossPreviewWidget(QWidget):
         self._side_images: Dict[str, List[Image.Image]] = {
             'top': [], 'right': [], 'bottom': [], 'left': []
         }
-        self._side_indices: Dict[str, int] = {
-            'top': 0, 'right': 0, 'bottom': 0, 'left': 0
-        }
+        self._side_indices: List[int] = [0, 0, 0, 0]  # indexed like SIDES
+        # (id(image), size) -> (image, pixmap); holding the image keeps its id from being reused
+        self._pixmap_cache: Dict[Tuple[int, int], Tuple[Image.Image, QPixmap]] = {}
+        # Checkerboards behind the five tile slots, rendered once
+        self._bg_pixmap: Optional[QPixmap] = None
+        # The whole preview with no tiles set, rendered on the first empty paint
+        self._empty_pixmap: Optional[QPixmap] = None
+        # Fonts for the "?" placeholder and the count labels
+        self._center_font = QFont()
+        self._center_font.setPixelSize(24)
+        self._label_font = QFont()
+        self._label_font.setPixelSize(11)
+        self._label_font.setBold(True)
         
         margin = 26
+        ts = self.TILE_SIZE
+        # Top-left corners of the tile slots; sides carry their index-list slot
+        self._center_pos = (margin + ts, margin + ts)
+        self._side_pos = (
+            ('top', _SIDE_SLOT['top'], margin + ts, margin),
+            ('right', _SIDE_SLOT['right'], margin + ts * 2, margin + ts),
+            ('bottom', _SIDE_SLOT['bottom'], margin + ts, margin + ts * 2),
+            ('left', _SIDE_SLOT['left'], margin, margin + ts),
+        )
+        # Count label box and alignment of each side, indexed like SIDES
+        centered = Qt.AlignmentFlag.AlignCenter
+        labels = {
+            'top': (QRect(margin + ts, margin - 14, ts, 14), centered),
+            'right': (QRect(margin + ts * 3 + 2, margin + ts, margin - 4, ts),
+                      Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft),
+            'bottom': (QRect(margin + ts, margin + ts * 3 + 2, ts, 14), centered),
+            'left': (QRect(2, margin + ts, margin - 4, ts),
+                     Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight),
+        }
+        self._label_rects = tuple(labels[side] for side in SIDES)
+        
         size = self.TILE_SIZE * 3 + margin * 2
         self.setFixedSize(size, size)
         self.setStyleSheet("background-color: #1a1a1a;")
@@ -125,25 +187,47 @@ class CrossPreviewWidget(QWidget):
     
     def set_center(self, image: Optional[Image.Image]) -> None:
         self._center_image = image
+        self._prune_pixmap_cache()
         self.update()
     
     def set_side_images(self, side: str, images: List[Image.Image]) -> None:
         if side in self._side_images:
             self._side_images[side] = images
-            self._side_indices[side] = 0
+            self._side_indices[_SIDE_SLOT[side]] = 0
+            self._prune_pixmap_cache()
             self.update()
     
-    def set_indices(self, indices: Dict[str, int]) -> None:
-        self._side_indices = indices.copy()
-        self.update()
+    def set_indices(self, indices: List[int]) -> None:
+        changed = [slot for slot, (old, new) in enumerate(zip(self._side_indices, indices))
+                   if old != new]
+        self._side_indices = list(indices)
+        for slot in changed:
+            self._update_side(slot)
+    
+    def _update_side(self, slot: int) -> None:
+        """Repaint only one side's tile and count label."""
+        ts = self.TILE_SIZE
+        _, _, x, y = self._side_pos[slot]
+        self.update(QRect(x, y, ts, ts))
+        self.update(self._label_rects[slot][0])
     
     def clear(self) -> None:
         self._center_image = None
         for side in self._side_images:
             self._side_images[side] = []
-            self._side_indices[side] = 0
+        self._side_indices = [0, 0, 0, 0]
+        self._pixmap_cache.clear()
         self.update()
     
+    def _prune_pixmap_cache(self) -> None:
+        """Drop cached pixmaps of images that are no longer shown."""
+        live = {id(img) for images in self._side_images.values() for img in images}
+        if self._center_image is not None:
+            live.add(id(self._center_image))
+        self._pixmap_cache = {
+            key: value for key, value in self._pixmap_cache.items() if key[0] in live
+        }
+    
     def _get_side_at_pos(self, x: int, y: int) -> Optional[str]:
         ts = self.TILE_SIZE
         margin = 26
@@ -164,20 +248,41 @@ class CrossPreviewWidget(QWidget):
             side = self._get_side_at_pos(int(event.position().x()), int(event.position().y()))
             if side and len(self._side_images.get(side, [])) > 1:
                 count = len(self._side_images[side])
-                self._side_indices[side] = (self._side_indices[side] + 1) % count
-                self.update()
+                slot = _SIDE_SLOT[side]
+                self._side_indices[slot] = (self._side_indices[slot] + 1) % count
+                self._update_side(slot)
     
     def _pil_to_pixmap(self, image: Image.Image, size: int) -> QPixmap:
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        image = image.resize((size, size), Image.Resampling.NEAREST)
+        key = (id(image), size)
+        cached = self._pixmap_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        pixmap = self._convert_pil(image, size)
+        self._pixmap_cache[key] = (image, pixmap)
+        return pixmap
+    
+    def _convert_pil(self, image: Image.Image, size: int) -> QPixmap:
+        # Images arrive as RGBA through CrossPreviewPanel.set_center/set_side_images.
+        # Wrap the tile-sized buffer and let Qt do the nearest-neighbor upscale:
+        # scaled() returns an image that owns its pixels, so only the small
+        # source buffer is ever copied out of PIL
         data = image.tobytes('raw', 'RGBA')
-        qimage = QImage(data, image.width, image.height, QImage.Format.Format_RGBA8888)
+        qimage = QImage(data, image.width, image.height, 4 * image.width, QImage.Format.Format_RGBA8888)
+        qimage = qimage.scaled(size, size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                               Qt.TransformationMode.FastTransformation)
         return QPixmap.fromImage(qimage)
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+    def resizeEvent(self, event):
+        self._bg_pixmap = None
+        self._empty_pixmap = None
+        super().resizeEvent(event)
+    
+    def _build_background(self) -> QPixmap:
+        """Render the checkerboards behind the five tile slots."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
         
         ts = self.TILE_SIZE
         margin = 26
@@ -188,47 +293,88 @@ class CrossPreviewWidget(QWidget):
         c2 = QColor(30, 30, 30)
         cs = 16
         
-        positions = {
-            'top': (ox + ts, oy),
-            'left': (ox, oy + ts),
-            'center': (ox + ts, oy + ts),
-            'right': (ox + ts * 2, oy + ts),
-            'bottom': (ox + ts, oy + ts * 2)
-        }
+        positions = [
+            (ox + ts, oy),
+            (ox, oy + ts),
+            (ox + ts, oy + ts),
+            (ox + ts * 2, oy + ts),
+            (ox + ts, oy + ts * 2)
+        ]
+        
+        # One 2x2-cell block of the pattern, tiled by a texture brush
+        block = QPixmap(cs * 2, cs * 2)
+        block.fill(c1)
+        painter = QPainter(block)
+        painter.fillRect(cs, 0, cs, cs, c2)
+        painter.fillRect(0, cs, cs, cs, c2)
+        painter.end()
+        brush = QBrush(block)
         
-        for name, (x, y) in positions.items():
-            for cy in range(0, ts, cs):
-                for cx in range(0, ts, cs):
-                    color = c1 if ((cx // cs + cy // cs) % 2 == 0) else c2
-                    painter.fillRect(x + cx, y + cy, cs, cs, color)
+        # Whole cells, so the last row/column overhangs the slot like per-cell drawing did
+        span = -(-ts // cs) * cs
+        
+        painter = QPainter(pixmap)
+        for x, y in positions:
+            painter.setBrushOrigin(x, y)
+            painter.fillRect(x, y, span, span, brush)
+        painter.end()
+        return pixmap
+    
+    def _is_empty(self) -> bool:
+        return self._center_image is None and not any(self._side_images.values())
+    
+    def paintEvent(self, event):
+        if self._is_empty():
+            # Nothing selected: the frame never changes, so blit it
+            dpr = self.devicePixelRatioF()
+            if self._empty_pixmap is None or self._empty_pixmap.devicePixelRatio() != dpr:
+                self._empty_pixmap = QPixmap(self.size() * dpr)
+                self._empty_pixmap.setDevicePixelRatio(dpr)
+                self._empty_pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(self._empty_pixmap)
+                self._paint(painter, self.rect())
+                painter.end()
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._empty_pixmap)
+            return
+        
+        painter = QPainter(self)
+        self._paint(painter, event.rect())
+    
+    def _paint(self, painter: QPainter, dirty: QRect) -> None:
+        """Draw the preview; tiles and labels outside the dirty rect are skipped."""
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        
+        ts = self.TILE_SIZE
+        margin = 26
+        ox, oy = margin, margin
+        
+        # Checkerboard
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._bg_pixmap = self._build_background()
+        painter.drawPixmap(0, 0, self._bg_pixmap)
         
         # Center tile
-        cx, cy = positions['center']
-        if self._center_image:
-            pixmap = self._pil_to_pixmap(self._center_image, ts)
-            painter.drawPixmap(cx, cy, pixmap)
-        else:
-            painter.setPen(QColor(50, 50, 50))
-            painter.drawRect(cx, cy, ts - 1, ts - 1)
-            font = QFont()
-            font.setPixelSize(24)
-            painter.setFont(font)
-            painter.drawText(cx, cy, ts, ts, Qt.AlignmentFlag.AlignCenter, "?")
+        cx, cy = self._center_pos
+        if dirty.intersects(QRect(cx, cy, ts, ts)):
+            if self._center_image:
+                pixmap = self._pil_to_pixmap(self._center_image, ts)
+                painter.drawPixmap(cx, cy, pixmap)
+            else:
+                painter.setPen(QColor(50, 50, 50))
+                painter.drawRect(cx, cy, ts - 1, ts - 1)
+                painter.setFont(self._center_font)
+                painter.drawText(cx, cy, ts, ts, Qt.AlignmentFlag.AlignCenter, "?")
         
         # Side tiles
-        side_pos = {
-            'top': (ox + ts, oy),
-            'right': (ox + ts * 2, oy + ts),
-            'bottom': (ox + ts, oy + ts * 2),
-            'left': (ox, oy + ts)
-        }
-        
-        for side, (x, y) in side_pos.items():
+        for side, slot, x, y in self._side_pos:
+            if not dirty.intersects(QRect(x, y, ts, ts)):
+                continue
             images = self._side_images.get(side, [])
             count = len(images)
             
             if count > 0:
-                idx = self._side_indices.get(side, 0) % count
+                idx = self._side_indices[slot] % count
                 pixmap = self._pil_to_pixmap(images[idx], ts)
                 painter.drawPixmap(x, y, pixmap)
             else:
@@ -243,25 +389,16 @@ class CrossPreviewWidget(QWidget):
             painter.drawLine(ox, oy + i * ts, ox + ts * 3, oy + i * ts)
         
         # Count labels in margins
-        font = QFont()
-        font.setPixelSize(11)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._label_font)
         painter.setPen(QColor(80, 80, 100))
         
-        for side, (x, y) in side_pos.items():
+        for side, slot, x, y in self._side_pos:
             images = self._side_images.get(side, [])
             count = len(images)
             if count > 0:
-                idx = self._side_indices.get(side, 0) % count
+                idx = self._side_indices[slot] % count
                 text = f"{idx + 1}/{count}" if count > 1 else "1"
-                
-                if side == 'top':
-                    painter.drawText(x, oy - 14, ts, 14, Qt.AlignmentFlag.AlignCenter, text)
-                elif side == 'bottom':
-                    painter.drawText(x, oy + ts * 3 + 2, ts, 14, Qt.AlignmentFlag.AlignCenter, text)
-                elif side == 'left':
-                    painter.drawText(2, y, margin - 4, ts, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, text)
-                elif side == 'right':
-                    painter.drawText(ox + ts * 3 + 2, y, margin - 4, ts, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+                rect, alignment = self._label_rects[slot]
+                if dirty.intersects(rect):
+                    painter.drawText(rect, alignment, text)
 
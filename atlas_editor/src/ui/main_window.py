@@ -5,12 +5,18 @@ Main application window for the WFC Atlas Editor.
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QSplitter,
     QMenuBar, QMenu, QFileDialog, QMessageBox, QApplication,
-    QStatusBar, QLabel, QCheckBox
+    QStatusBar, QLabel, QCheckBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, QSettings
-from PySide6.QtGui import QAction, QKeySequence, QCloseEvent
+from PySide6.QtCore import (
+    Qt, QSettings, QTimer, Slot, Signal, QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QAction, QKeySequence, QCloseEvent, QPalette, QColor
 from pathlib import Path
 from typing import Optional
+import logging
+import os
+import re
+from PIL import Image
 
 from ..models import Atlas, Settings
 from ..core import save_atlas, load_atlas, propagate_all_rules, cleanup_extraction
@@ -19,6 +25,131 @@ from .cross_preview_panel import CrossPreviewPanel
 from .rule_controls_panel import RuleControlsPanel
 from .validation_panel import ValidationPanel
 
+logger = logging.getLogger(__name__)
+
+# Set WFC_NON_NATIVE_DIALOGS to use Qt's own file dialogs, e.g. for scripted runs
+_FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseNativeDialog
+                        if os.environ.get("WFC_NON_NATIVE_DIALOGS")
+                        else QFileDialog.Option(0))
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and layout whitespace so Qt has less stylesheet text to parse."""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.DOTALL)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r' ?([{};:,]) ?', r'\1', qss).strip()
+
+
+def _dark_palette() -> QPalette:
+    """Base colors of the dark theme, applied as a palette rather than a QWidget rule."""
+    palette = QPalette()
+    background = QColor("#2d2d2d")
+    text = QColor("#e0e0e0")
+    for role in (QPalette.ColorRole.Window, QPalette.ColorRole.Base,
+                 QPalette.ColorRole.AlternateBase, QPalette.ColorRole.Button,
+                 QPalette.ColorRole.ToolTipBase):
+        palette.setColor(role, background)
+    for role in (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text,
+                 QPalette.ColorRole.ButtonText, QPalette.ColorRole.ToolTipText):
+        palette.setColor(role, text)
+    return palette
+
+
+# Dark theme, minified once at import and shared by every window.
+# Plain background and text colors come from _dark_palette(); the sheet only
+# covers what a palette cannot express.
+_DARK_STYLESHEET = _minify_qss("""
+QMenuBar {
+    background-color: #353535;
+    color: #e0e0e0;
+    border-bottom: 1px solid #454545;
+}
+QMenuBar::item:selected {
+    background-color: #454545;
+}
+QMenu {
+    background-color: #353535;
+    color: #e0e0e0;
+    border: 1px solid #454545;
+}
+QMenu::item:selected {
+    background-color: #4a90d9;
+}
+QStatusBar {
+    background-color: #353535;
+    color: #a0a0a0;
+    border-top: 1px solid #454545;
+}
+QSplitter::handle {
+    background-color: #454545;
+}
+QScrollBar:vertical {
+    background-color: #2a2a2a;
+    width: 12px;
+    border: none;
+}
+QScrollBar::handle:vertical {
+    background-color: #4a4a4a;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: #5a5a5a;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0;
+}
+QLineEdit {
+    background-color: #3a3a3a;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 5px;
+}
+QLineEdit:focus {
+    border-color: #4a90d9;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+}
+QCheckBox::indicator:unchecked {
+    background-color: #3a3a3a;
+    border: 1px solid #555;
+    border-radius: 3px;
+}
+QCheckBox::indicator:checked {
+    background-color: #4a90d9;
+    border: 1px solid #4a90d9;
+    border-radius: 3px;
+}
+""")
+
+
+class PropagateWorker(QRunnable):
+    """
+    Runs propagate_all_rules on a thread pool thread.
+    
+    The result is reported through signals, which Qt queues back to the
+    GUI thread.
+    """
+    
+    class Signals(QObject):
+        finished = Signal(int)  # Emits the number of generated rules
+        failed = Signal(str)    # Emits the error message
+    
+    def __init__(self, atlas: Atlas):
+        super().__init__()
+        self._atlas = atlas
+        self.signals = PropagateWorker.Signals()
+    
+    def run(self):
+        try:
+            count = propagate_all_rules(self._atlas)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(count)
+
 
 class MainWindow(QMainWindow):
     """
@@ -27,102 +158,57 @@ class MainWindow(QMainWindow):
     
     APP_NAME = "WFC Atlas Editor"
     FILE_FILTER = "Tile Rules (*.tr);;All Files (*)"
+    # Extension enforced by each entry of FILE_FILTER; other filters keep a
+    # known extension and default to .tr
+    FILTER_EXTENSIONS = {"Tile Rules (*.tr)": ".tr"}
+    KNOWN_EXTENSIONS = ('.tr', '.json')
+    # Transformed tile images kept for the cross preview, most recent last
+    IMAGE_CACHE_SIZE = 256
+    
+    # Class-level settings, shared by every window like TilePickerDialog's
+    _settings = QSettings("WFC", "AtlasEditor")
     
     def __init__(self):
         super().__init__()
         self._atlas: Optional[Atlas] = None
-        self._settings = QSettings("WFC", "AtlasEditor")
+        self._last_selected_tile_id: Optional[str] = None
+        self._image_cache: dict[str, Image.Image] = {}
+        # (file_path, display name) of the last title, to avoid re-parsing the path
+        self._title_name: tuple[Optional[str], str] = (None, "Untitled")
+        # Confirmation dialogs, created on first use and reused afterwards
+        self._question_boxes: dict[str, QMessageBox] = {}
+        # Running propagation, if any
+        self._propagate_worker: Optional[PropagateWorker] = None
+        self._propagate_progress: Optional[QProgressDialog] = None
+        # While set, refreshes are only collected and run once propagation ends
+        self._propagating = False
+        
+        # Panel refreshes requested during one event loop turn run once
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._refresh_rule_controls = False
         
         self._setup_ui()
         self._setup_menu()
+        self._apply_theme()
         self._setup_connections()
         self._restore_state()
         
-        # Create new empty atlas
-        self._new_atlas()
+        # Create the empty atlas once the event loop runs, so the window can
+        # paint first; menus and geometry stay here to avoid a visible jump
+        QTimer.singleShot(0, self._finish_init)
+    
+    def _finish_init(self):
+        """Create the initial empty atlas unless one was opened already."""
+        if self._atlas is None:
+            self._new_atlas()
     
     def _setup_ui(self):
         self.setWindowTitle(self.APP_NAME)
         self.setMinimumSize(1000, 700)
         
-        # Apply dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2d2d2d;
-            }
-            QWidget {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            QMenuBar {
-                background-color: #353535;
-                color: #e0e0e0;
-                border-bottom: 1px solid #454545;
-            }
-            QMenuBar::item:selected {
-                background-color: #454545;
-            }
-            QMenu {
-                background-color: #353535;
-                color: #e0e0e0;
-                border: 1px solid #454545;
-            }
-            QMenu::item:selected {
-                background-color: #4a90d9;
-            }
-            QStatusBar {
-                background-color: #353535;
-                color: #a0a0a0;
-                border-top: 1px solid #454545;
-            }
-            QSplitter::handle {
-                background-color: #454545;
-            }
-            QScrollBar:vertical {
-                background-color: #2a2a2a;
-                width: 12px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #4a4a4a;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #5a5a5a;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QLineEdit {
-                background-color: #3a3a3a;
-                color: #e0e0e0;
-                border: 1px solid #555;
-                border-radius: 3px;
-                padding: 5px;
-            }
-            QLineEdit:focus {
-                border-color: #4a90d9;
-            }
-            QCheckBox {
-                color: #e0e0e0;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #3a3a3a;
-                border: 1px solid #555;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4a90d9;
-                border: 1px solid #4a90d9;
-                border-radius: 3px;
-            }
-        """)
-        
         # Central widget
         central = QWidget()
         self.setCentralWidget(central)
@@ -162,65 +248,64 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.splitter)
         
         # Status bar
-        self.statusBar().showMessage("Ready")
+        self.status_bar = self.statusBar()
+        self.status_bar.showMessage("Ready")
         
         # Settings bar in status
         self.auto_rotate_check = QCheckBox("Auto-propagate rotations")
         self.auto_rotate_check.setChecked(True)
         self.auto_rotate_check.stateChanged.connect(self._on_settings_changed)
-        self.statusBar().addPermanentWidget(self.auto_rotate_check)
+        self.status_bar.addPermanentWidget(self.auto_rotate_check)
         
         self.auto_mirror_check = QCheckBox("Auto-propagate mirrors")
         self.auto_mirror_check.setChecked(True)
         self.auto_mirror_check.stateChanged.connect(self._on_settings_changed)
-        self.statusBar().addPermanentWidget(self.auto_mirror_check)
+        self.status_bar.addPermanentWidget(self.auto_mirror_check)
+    
+    def _apply_theme(self):
+        """
+        Apply the dark theme once the widget tree and menus are built, so the
+        stylesheet is matched in a single pass instead of on every child added.
+        """
+        self.setUpdatesEnabled(False)
+        # The palette is set app-wide because windows do not inherit their
+        # parent's palette, and dialogs should stay dark too
+        QApplication.setPalette(_dark_palette())
+        self.setStyleSheet(_DARK_STYLESHEET)
+        self.setUpdatesEnabled(True)
     
     def _setup_menu(self):
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu("&File")
-        
-        new_action = QAction("&New", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._on_new)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._on_open)
-        file_menu.addAction(open_action)
-        
-        file_menu.addSeparator()
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._on_save)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        save_as_action.triggered.connect(self._on_save_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-        
-        propagate_action = QAction("&Propagate All Rules", self)
-        propagate_action.setShortcut(QKeySequence("Ctrl+P"))
-        propagate_action.triggered.connect(self._on_propagate_all)
-        edit_menu.addAction(propagate_action)
-        
-        clear_auto_action = QAction("&Clear Auto-generated Rules", self)
-        clear_auto_action.triggered.connect(self._on_clear_auto_rules)
-        edit_menu.addAction(clear_auto_action)
+        # (text, shortcut, slot) per action, None for a separator. Shortcuts are
+        # plain strings so no platform key binding table is consulted.
+        menus = (
+            ("&File", (
+                ("&New", "Ctrl+N", self._on_new),
+                ("&Open...", "Ctrl+O", self._on_open),
+                None,
+                ("&Save", "Ctrl+S", self._on_save),
+                ("Save &As...", "Ctrl+Shift+S", self._on_save_as),
+                None,
+                ("E&xit", "Ctrl+Q", self.close),
+            )),
+            ("&Edit", (
+                ("&Propagate All Rules", "Ctrl+P", self._on_propagate_all),
+                ("&Clear Auto-generated Rules", None, self._on_clear_auto_rules),
+            )),
+        )
+        for title, entries in menus:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = entry
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(QKeySequence(shortcut))
+                action.triggered.connect(slot)
+                menu.addAction(action)
     
     def _setup_connections(self):
         # Tiles panel -> other panels
@@ -247,31 +332,47 @@ class MainWindow(QMainWindow):
             self.restoreState(state)
     
     def _save_state(self):
-        """Save window state to settings."""
-        self._settings.setValue("geometry", self.saveGeometry())
-        self._settings.setValue("windowState", self.saveState())
+        """Save window state to settings, touching the disk only if it changed."""
+        changed = False
+        for key, value in (("geometry", self.saveGeometry()),
+                           ("windowState", self.saveState())):
+            if self._settings.value(key) != value:
+                self._settings.setValue(key, value)
+                changed = True
+        # setValue only updates QSettings' in-memory cache; write it out once here
+        if changed:
+            self._settings.sync()
     
     def _new_atlas(self):
         """Create a new empty atlas."""
-        # Cleanup previous atlas extraction if any
-        if self._atlas:
-            cleanup_extraction(self._atlas)
-        
+        self._close_atlas()
         self._atlas = Atlas()
         self._update_title()
         self._update_panels()
     
+    def _close_atlas(self):
+        """Remove the extraction cache of the current atlas, if any."""
+        if self._atlas:
+            cleanup_extraction(self._atlas)
+    
     def _update_title(self):
-        """Update window title."""
+        """Update window title, skipping the window system call if it is unchanged."""
         if self._atlas:
-            name = Path(self._atlas.file_path).name if self._atlas.file_path else "Untitled"
+            file_path = self._atlas.file_path
+            if file_path != self._title_name[0]:
+                self._title_name = (file_path, Path(file_path).name if file_path else "Untitled")
+            name = self._title_name[1]
             modified = " *" if self._atlas.modified else ""
-            self.setWindowTitle(f"{name}{modified} - {self.APP_NAME}")
+            title = f"{name}{modified} - {self.APP_NAME}"
         else:
-            self.setWindowTitle(self.APP_NAME)
+            title = self.APP_NAME
+        if title != self.windowTitle():
+            self.setWindowTitle(title)
     
     def _update_panels(self):
         """Update all panels with current atlas."""
+        self._last_selected_tile_id = None
+        self._image_cache.clear()
         self.tiles_panel.set_atlas(self._atlas)
         self.rule_controls_panel.set_atlas(self._atlas)
         self.rule_controls_panel.set_image_getter(self.tiles_panel.get_tile_image)
@@ -286,8 +387,8 @@ class MainWindow(QMainWindow):
     def _check_unsaved(self) -> bool:
         """Check for unsaved changes. Returns True if OK to proceed."""
         if self._atlas and self._atlas.modified:
-            result = QMessageBox.question(
-                self, "Unsaved Changes",
+            result = self._ask(
+                "Unsaved Changes",
                 "You have unsaved changes. Do you want to save them?",
                 QMessageBox.StandardButton.Save | 
                 QMessageBox.StandardButton.Discard | 
@@ -301,12 +402,22 @@ class MainWindow(QMainWindow):
         
         return True
     
+    def _ask(self, title: str, text: str,
+             buttons: QMessageBox.StandardButton) -> QMessageBox.StandardButton:
+        """Ask a question like QMessageBox.question, reusing one dialog per title."""
+        box = self._question_boxes.get(title)
+        if box is None:
+            box = QMessageBox(QMessageBox.Icon.Question, title, text, buttons, self)
+            self._question_boxes[title] = box
+        box.exec()
+        return box.standardButton(box.clickedButton())
+    
     def _on_new(self):
         """Handle new atlas action."""
         if not self._check_unsaved():
             return
         self._new_atlas()
-        self.statusBar().showMessage("Created new atlas", 3000)
+        self.status_bar.showMessage("Created new atlas", 3000)
     
     def _on_open(self):
         """Handle open atlas action."""
@@ -315,22 +426,25 @@ class MainWindow(QMainWindow):
         
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Open Atlas",
-            "",
-            self.FILE_FILTER
+            self._settings.value("lastDirectory", ""),
+            self.FILE_FILTER,
+            options=_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
+            self._settings.setValue("lastDirectory", str(Path(file_path).parent))
             try:
-                # Cleanup previous atlas extraction if any
-                if self._atlas:
-                    cleanup_extraction(self._atlas)
-                
-                self._atlas = load_atlas(file_path)
-                self._update_title()
-                self._update_panels()
-                self.statusBar().showMessage(f"Opened {Path(file_path).name}", 3000)
+                atlas = load_atlas(file_path)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open file: {e}")
+            else:
+                # Only release the previous atlas once the new one loaded, so
+                # a failed open leaves the current atlas fully usable
+                self._close_atlas()
+                self._atlas = atlas
+                self._update_title()
+                self._update_panels()
+                self.status_bar.showMessage(f"Opened {Path(file_path).name}", 3000)
     
     def _on_save(self) -> bool:
         """Handle save atlas action. Returns True if saved."""
@@ -343,7 +457,7 @@ class MainWindow(QMainWindow):
         try:
             save_atlas(self._atlas, self._atlas.file_path)
             self._update_title()
-            self.statusBar().showMessage(f"Saved {Path(self._atlas.file_path).name}", 3000)
+            self.status_bar.showMessage(f"Saved {Path(self._atlas.file_path).name}", 3000)
             return True
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
@@ -356,72 +470,112 @@ class MainWindow(QMainWindow):
         
         file_path, selected_filter = QFileDialog.getSaveFileName(
             self, "Save Atlas As",
-            "",
-            self.FILE_FILTER
+            self._settings.value("lastDirectory", ""),
+            self.FILE_FILTER,
+            options=_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
+            self._settings.setValue("lastDirectory", str(Path(file_path).parent))
             # Add extension based on selected filter
-            if "*.tr" in selected_filter and not file_path.endswith('.tr'):
-                file_path += '.tr'
-            elif "*.json" in selected_filter and not file_path.endswith('.json'):
-                file_path += '.json'
-            elif not file_path.endswith('.tr') and not file_path.endswith('.json'):
+            ext = self.FILTER_EXTENSIONS.get(selected_filter)
+            if ext is not None:
+                if not file_path.endswith(ext):
+                    file_path += ext
+            elif not file_path.endswith(self.KNOWN_EXTENSIONS):
                 file_path += '.tr'  # Default to .tr
             
             try:
                 save_atlas(self._atlas, file_path)
                 self._update_title()
-                self.statusBar().showMessage(f"Saved {Path(file_path).name}", 3000)
+                self.status_bar.showMessage(f"Saved {Path(file_path).name}", 3000)
                 return True
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {e}")
         
         return False
     
+    @Slot(str)
     def _on_tile_selected(self, tile_id: str):
         """Handle tile selection."""
+        if tile_id == self._last_selected_tile_id:
+            return
+        self._last_selected_tile_id = tile_id
+        
         # Update cross preview
-        if tile_id and self._atlas:
-            tile = self._atlas.get_tile(tile_id)
-            if tile:
-                self.cross_preview_panel.set_selected_tile(tile.id)
-                image = self.tiles_panel.get_tile_image(tile_id)
-                self.cross_preview_panel.set_center(image)
-            else:
-                self.cross_preview_panel.clear()
+        tile = self._atlas.get_tile(tile_id) if tile_id and self._atlas else None
+        if tile is not None:
+            self.cross_preview_panel.set_selected_tile(tile.id)
+            self.cross_preview_panel.set_center(self._get_tile_image(tile_id))
         else:
             self.cross_preview_panel.clear()
         
         # Update rule controls
         self.rule_controls_panel.set_selected_tile(tile_id)
     
+    @Slot(str, list)
     def _on_neighbors_updated(self, side: str, neighbor_ids: list):
         """Handle neighbor list update from rule controls."""
         images = []
         for nid in neighbor_ids:
-            img = self.tiles_panel.get_tile_image(nid)
+            img = self._get_tile_image(nid)
             if img:
                 images.append(img)
         self.cross_preview_panel.set_side_images(side, images)
     
+    def _get_tile_image(self, tile_id: str) -> Optional[Image.Image]:
+        """
+        Get a tile image through a small LRU cache.
+        
+        TilesPanel.get_tile_image builds a new transformed copy on every call;
+        reusing the same object also lets the cross preview reuse its pixmaps.
+        """
+        image = self._image_cache.pop(tile_id, None)
+        if image is None:
+            image = self.tiles_panel.get_tile_image(tile_id)
+            if image is None:
+                return None
+            if len(self._image_cache) >= self.IMAGE_CACHE_SIZE:
+                del self._image_cache[next(iter(self._image_cache))]
+        self._image_cache[tile_id] = image
+        return image
+    
+    @Slot()
     def _on_atlas_modified(self):
         """Handle atlas modification."""
-        tiles_count = len(self._atlas.tiles) if self._atlas else 0
-        print(f"[MainWindow._on_atlas_modified] Atlas has {tiles_count} tiles, refreshing panels")
+        logger.debug("Atlas has %d tiles, refreshing panels",
+                     len(self._atlas.tiles) if self._atlas else 0)
         if self._atlas:
             self._atlas.modified = True
-        self._update_title()
-        self.rule_controls_panel.refresh()
-        self.validation_panel.refresh()
+        # Tiles may have been imported or removed under the same ids
+        self._last_selected_tile_id = None
+        self._image_cache.clear()
+        self._schedule_refresh(rule_controls=True)
     
+    @Slot()
     def _on_rules_changed(self):
         """Handle rules change."""
         if self._atlas:
             self._atlas.modified = True
+        # The rule controls made the change and are already up to date
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self, rule_controls: bool = False):
+        """Refresh the title and validation (and optionally rule controls) on the next event loop turn."""
+        self._refresh_rule_controls |= rule_controls
+        if not self._propagating:
+            self._refresh_timer.start()
+    
+    @Slot()
+    def _do_refresh(self):
+        """Run the refreshes collected by _schedule_refresh."""
         self._update_title()
+        if self._refresh_rule_controls:
+            self._refresh_rule_controls = False
+            self.rule_controls_panel.refresh()
         self.validation_panel.refresh()
     
+    @Slot(str)
     def _on_validation_tile_clicked(self, tile_id: str):
         """Handle click on validation item."""
         self.tiles_panel.select_tile(tile_id)
@@ -430,52 +584,82 @@ class MainWindow(QMainWindow):
     def _on_settings_changed(self):
         """Handle settings checkbox change."""
         if self._atlas:
-            self._atlas.settings.auto_propagate_rotations = self.auto_rotate_check.isChecked()
-            self._atlas.settings.auto_propagate_mirrors = self.auto_mirror_check.isChecked()
+            self._atlas.settings = Settings(
+                auto_propagate_rotations=self.auto_rotate_check.isChecked(),
+                auto_propagate_mirrors=self.auto_mirror_check.isChecked()
+            )
             self._atlas.modified = True
             self._update_title()
     
     def _on_propagate_all(self):
-        """Propagate all rules to transform variants."""
-        if not self._atlas:
+        """Propagate all rules to transform variants on a worker thread."""
+        if not self._atlas or self._propagate_worker is not None:
             return
         
-        count = propagate_all_rules(self._atlas)
-        self._atlas.modified = True
-        self._update_title()
-        self.rule_controls_panel.refresh()
-        self.validation_panel.refresh()
-        
+        # Nothing may read the atlas while the worker changes it; the modal
+        # progress dialog blocks edits, debounced section edits are reported
+        # now, and refreshes wait until the end
+        self.rule_controls_panel.flush_pending_edits()
+        self._propagating = True
+        self._refresh_timer.stop()
+        progress = QProgressDialog("Propagating rules...", None, 0, 0, self)
+        progress.setWindowTitle("Propagate All Rules")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        self._propagate_progress = progress
+        
+        worker = PropagateWorker(self._atlas)
+        worker.signals.finished.connect(self._on_propagate_finished)
+        worker.signals.failed.connect(self._on_propagate_failed)
+        self._propagate_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _end_propagation(self):
+        """Close the progress dialog and refresh after the worker is done."""
+        self._propagate_progress.close()
+        self._propagate_progress.deleteLater()
+        self._propagate_progress = None
+        self._propagate_worker = None
+        self._propagating = False
+        if self._atlas:
+            self._atlas.modified = True
+        self._schedule_refresh(rule_controls=True)
+    
+    @Slot(int)
+    def _on_propagate_finished(self, count: int):
+        self._end_propagation()
         QMessageBox.information(
             self, "Propagation Complete",
             f"Generated {count} auto-propagated rules."
         )
     
+    @Slot(str)
+    def _on_propagate_failed(self, message: str):
+        self._end_propagation()
+        QMessageBox.critical(self, "Error", f"Failed to propagate rules: {message}")
+    
     def _on_clear_auto_rules(self):
         """Clear all auto-generated rules."""
         if not self._atlas:
             return
         
-        result = QMessageBox.question(
-            self, "Clear Auto Rules",
+        result = self._ask(
+            "Clear Auto Rules",
             "Are you sure you want to remove all auto-generated rules?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if result == QMessageBox.StandardButton.Yes:
             count = self._atlas.remove_auto_rules()
-            self._update_title()
-            self.rule_controls_panel.refresh()
-            self.validation_panel.refresh()
-            self.statusBar().showMessage(f"Removed {count} auto-generated rules", 3000)
+            self._schedule_refresh(rule_controls=True)
+            self.status_bar.showMessage(f"Removed {count} auto-generated rules", 3000)
     
     def closeEvent(self, event: QCloseEvent):
         """Handle window close."""
         if self._check_unsaved():
             self._save_state()
-            # Cleanup extraction cache when closing
-            if self._atlas:
-                cleanup_extraction(self._atlas)
+            self._close_atlas()
             event.accept()
         else:
             event.ignore()
@@ -4,24 +4,126 @@ Rule controls panel - side sections for adding/editing adjacency rules.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QComboBox
+    QScrollArea, QFrame, QComboBox, QApplication
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QWheelEvent
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QObject, QEvent, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QImage
 from PIL import Image
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
+import functools
+import logging
 
-from ..models import Atlas, Tile
+from ..models import Atlas, Tile, Side, parse_variant_id
 from ..core import SIDES
 from .widgets import TileThumbnail, PercentageSpinBox
 from .tile_picker_dialog import TilePickerDialog
 
+logger = logging.getLogger(__name__)
+
+# Static styling of the panel, its side sections and neighbor rows, set once
+# on RuleControlsPanel instead of on every widget it creates
+_PANEL_STYLESHEET = """
+    QLabel#panelHeader { font-weight: bold; font-size: 12px; color: #888; }
+    QScrollArea#sidesScroll { border: none; background: transparent; }
+    QPushButton#normalizeBtn {
+        background-color: #3a3a4a;
+        color: #a0a0c0;
+        border: 1px solid #4a4a5a;
+        border-radius: 3px;
+        padding: 6px;
+        font-size: 11px;
+    }
+    QPushButton#normalizeBtn:hover { background-color: #4a4a5a; }
+    
+    SideSection {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+    }
+    QLabel#sideName { font-weight: bold; color: #999; font-size: 12px; }
+    QLabel#sideWarning { color: #e0a030; font-size: 12px; }
+    QLabel#sideTotal { color: #777; font-size: 11px; }
+    QLabel#sideTotal[state="ok"] { color: #70a070; }
+    QLabel#sideTotal[state="warn"] { color: #e0a030; }
+    QLabel#sideTotal[state="empty"] { color: #c06060; }
+    QPushButton#addNeighborBtn {
+        background-color: #2a3a2a;
+        color: #8ab08a;
+        border: 1px dashed #3a4a3a;
+        border-radius: 3px;
+        padding: 5px;
+        font-size: 11px;
+    }
+    QPushButton#addNeighborBtn:hover { background-color: #3a4a3a; color: #a0c0a0; }
+    
+    QComboBox#variantCombo {
+        background-color: #383838;
+        color: #ddd;
+        border: 1px solid #4a4a4a;
+        border-radius: 3px;
+        padding: 3px 6px;
+        font-size: 11px;
+        min-width: 90px;
+    }
+    QComboBox#variantCombo:hover { border-color: #5a5a5a; }
+    QComboBox#variantCombo::drop-down { border: none; width: 18px; }
+    QComboBox#variantCombo QAbstractItemView {
+        background-color: #383838;
+        color: #ddd;
+        selection-background-color: #4a90d9;
+    }
+    QLabel#neighborName { color: #ccc; font-size: 11px; }
+    QLabel#autoTag { color: #777; }
+    QPushButton#removeBtn {
+        background-color: #4a3535;
+        color: #caa;
+        border: none;
+        border-radius: 11px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#removeBtn:hover { background-color: #5a4545; }
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _variant_display(vid: str) -> str:
+    """Combo box label of a variant id; cached since the same ids recur on every refresh."""
+    _, rotation, flip_x, flip_y = parse_variant_id(vid)
+    transforms = []
+    if rotation:
+        transforms.append(f"↻{rotation}°")
+    if flip_x:
+        transforms.append("↔")
+    if flip_y:
+        transforms.append("↕")
+    return " ".join(transforms) if transforms else "Original"
 
-class NoScrollComboBox(QComboBox):
-    """ComboBox that ignores mouse wheel events to prevent accidental changes."""
-    def wheelEvent(self, event: QWheelEvent) -> None:
-        # Ignore wheel events - let parent scroll area handle them
-        event.ignore()
+
+class _WheelGuard(QObject):
+    """Event filter that keeps unfocused combo boxes from eating wheel scrolls."""
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if (event.type() == QEvent.Type.Wheel and isinstance(obj, QComboBox)
+                and not obj.hasFocus()):
+            # Hand the tick to the enclosing scroll area instead
+            parent = obj.parentWidget()
+            while parent is not None and not isinstance(parent, QScrollArea):
+                parent = parent.parentWidget()
+            if parent is not None:
+                QApplication.sendEvent(parent.viewport(), event)
+            return True
+        return super().eventFilter(obj, event)
+
+
+_wheel_guard: Optional[_WheelGuard] = None
+
+
+def _get_wheel_guard() -> _WheelGuard:
+    """Single filter instance shared by every variant combo."""
+    global _wheel_guard
+    if _wheel_guard is None:
+        _wheel_guard = _WheelGuard()
+    return _wheel_guard
 
 
 class NeighborRow(QWidget):
@@ -30,12 +132,20 @@ class NeighborRow(QWidget):
     remove_requested = Signal(str)
     variant_changed = Signal(str, str)
     
-    def __init__(self, neighbor_id: str, weight: float, image: Optional[Image.Image],
+    THUMBNAIL_SIZE = 36
+    POOL_LIMIT = 64
+    
+    # Released rows, kept detached and rebound on the next acquire
+    _POOL: List['NeighborRow'] = []
+    
+    def __init__(self, neighbor_id: str, weight: float, pixmap: Optional[QPixmap],
                  auto_generated: bool = False, available_variants: Optional[List[str]] = None,
                  parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.neighbor_id = neighbor_id
-        self.available_variants = available_variants or []
+        self.auto_generated = auto_generated
+        self.available_variants: List[str] = []
+        self._pixmap: Optional[QPixmap] = None
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 3, 4, 3)
@@ -43,95 +153,132 @@ class NeighborRow(QWidget):
         
         # Thumbnail
         self.thumbnail = TileThumbnail(neighbor_id)
-        self.thumbnail.THUMBNAIL_SIZE = 36
+        self.thumbnail.THUMBNAIL_SIZE = self.THUMBNAIL_SIZE
         self.thumbnail.setFixedSize(42, 42)
-        if image:
-            self.thumbnail.set_image(image)
         layout.addWidget(self.thumbnail)
         
-        # Variant selector or name
-        if len(self.available_variants) > 1:
-            self.variant_combo = NoScrollComboBox()
-            self.variant_combo.setStyleSheet("""
-                QComboBox {
-                    background-color: #383838;
-                    color: #ddd;
-                    border: 1px solid #4a4a4a;
-                    border-radius: 3px;
-                    padding: 3px 6px;
-                    font-size: 11px;
-                    min-width: 90px;
-                }
-                QComboBox:hover { border-color: #5a5a5a; }
-                QComboBox::drop-down { border: none; width: 18px; }
-                QComboBox QAbstractItemView {
-                    background-color: #383838;
-                    color: #ddd;
-                    selection-background-color: #4a90d9;
-                }
-            """)
-            for v in self.available_variants:
-                self.variant_combo.addItem(self._variant_display(v), v)
-            idx = self.variant_combo.findData(neighbor_id)
-            if idx >= 0:
-                self.variant_combo.setCurrentIndex(idx)
-            self.variant_combo.currentIndexChanged.connect(self._on_variant_changed)
-            layout.addWidget(self.variant_combo, 1)
-        else:
-            name_lbl = QLabel(neighbor_id)
-            name_lbl.setStyleSheet("color: #ccc; font-size: 11px;")
-            name_lbl.setWordWrap(True)
-            layout.addWidget(name_lbl, 1)
-        
-        if auto_generated:
-            auto_lbl = QLabel("⚡")
-            auto_lbl.setToolTip("Auto-generated rule")
-            auto_lbl.setStyleSheet("color: #777;")
-            layout.addWidget(auto_lbl)
+        # Variant selector or name; both are built so a pooled row can be
+        # rebound to either kind of neighbor
+        self.variant_combo = QComboBox()
+        self.variant_combo.setObjectName("variantCombo")
+        self.variant_combo.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.variant_combo.installEventFilter(_get_wheel_guard())
+        self.variant_combo.currentIndexChanged.connect(self._on_variant_changed)
+        layout.addWidget(self.variant_combo, 1)
+        
+        self.name_lbl = QLabel()
+        self.name_lbl.setObjectName("neighborName")
+        self.name_lbl.setWordWrap(True)
+        layout.addWidget(self.name_lbl, 1)
+        
+        self.auto_lbl = QLabel("⚡")
+        self.auto_lbl.setToolTip("Auto-generated rule")
+        self.auto_lbl.setObjectName("autoTag")
+        layout.addWidget(self.auto_lbl)
         
         # Weight
         self.weight_spin = PercentageSpinBox()
-        self.weight_spin.setValue(weight)
-        self.weight_spin.valueChanged.connect(lambda v: self.weight_changed.emit(self.neighbor_id, v))
+        self.weight_spin.valueChanged.connect(self._emit_weight)
         layout.addWidget(self.weight_spin)
         
         # Remove button
         rm_btn = QPushButton("×")
         rm_btn.setFixedSize(22, 22)
-        rm_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4a3535;
-                color: #caa;
-                border: none;
-                border-radius: 11px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #5a4545; }
-        """)
-        rm_btn.clicked.connect(lambda: self.remove_requested.emit(self.neighbor_id))
+        rm_btn.setObjectName("removeBtn")
+        rm_btn.clicked.connect(self._emit_remove)
         layout.addWidget(rm_btn)
+        
+        self.bind(neighbor_id, weight, pixmap, auto_generated, available_variants)
     
-    def _variant_display(self, vid: str) -> str:
-        parts = vid.split('_')
-        if len(parts) == 1:
-            return "Original"
-        transforms = []
-        for p in parts[1:]:
-            if p.startswith('r'):
-                transforms.append(f"↻{p[1:]}°")
-            elif p == 'fx':
-                transforms.append("↔")
-            elif p == 'fy':
-                transforms.append("↕")
-        return " ".join(transforms) if transforms else vid
+    @classmethod
+    def acquire(cls, neighbor_id: str, weight: float, pixmap: Optional[QPixmap],
+                auto_generated: bool = False,
+                available_variants: Optional[List[str]] = None) -> 'NeighborRow':
+        """
+        Get a row bound to a neighbor, reusing a released one if there is any.
+        Reused rows are still hidden; show them once they are in a layout.
+        """
+        if cls._POOL:
+            row = cls._POOL.pop()
+            row.bind(neighbor_id, weight, pixmap, auto_generated, available_variants)
+            return row
+        return cls(neighbor_id, weight, pixmap, auto_generated, available_variants)
+    
+    @classmethod
+    def release(cls, row: 'NeighborRow') -> None:
+        """Detach a row from its section and keep it for reuse."""
+        row.hide()
+        for signal in (row.weight_changed, row.remove_requested, row.variant_changed):
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass  # Nothing connected
+        if len(cls._POOL) < cls.POOL_LIMIT:
+            row.setParent(None)
+            cls._POOL.append(row)
+        else:
+            row.deleteLater()
     
+    def bind(self, neighbor_id: str, weight: float, pixmap: Optional[QPixmap],
+             auto_generated: bool = False,
+             available_variants: Optional[List[str]] = None) -> None:
+        """Show another neighbor in this row without emitting any signals."""
+        self.neighbor_id = neighbor_id
+        self.auto_generated = auto_generated
+        self.thumbnail.set_tile_id(neighbor_id)
+        
+        variants = available_variants or []
+        if len(variants) > 1:
+            self.variant_combo.blockSignals(True)
+            if variants != self.available_variants:
+                self.variant_combo.clear()
+                for v in variants:
+                    self.variant_combo.addItem(_variant_display(v), v)
+            idx = self.variant_combo.findData(neighbor_id)
+            if idx >= 0:
+                self.variant_combo.setCurrentIndex(idx)
+            self.variant_combo.blockSignals(False)
+            self.variant_combo.show()
+            self.name_lbl.hide()
+        else:
+            self.variant_combo.hide()
+            self.name_lbl.setText(neighbor_id)
+            self.name_lbl.show()
+        self.available_variants = variants
+        
+        self.auto_lbl.setVisible(auto_generated)
+        self.set_weight(weight)
+        self.set_pixmap(pixmap)
+    
+    @Slot(float)
+    def _emit_weight(self, weight: float):
+        self.weight_changed.emit(self.neighbor_id, weight)
+    
+    @Slot()
+    def _emit_remove(self):
+        self.remove_requested.emit(self.neighbor_id)
+    
+    def set_weight(self, weight: float) -> None:
+        """Show a new weight without emitting weight_changed."""
+        self.weight_spin.blockSignals(True)
+        self.weight_spin.setValue(weight)
+        self.weight_spin.blockSignals(False)
+    
+    def set_pixmap(self, pixmap: Optional[QPixmap]) -> None:
+        """Show a new thumbnail, if it differs from the current one."""
+        if pixmap is not self._pixmap:
+            self._pixmap = pixmap
+            # Already thumbnail-sized, so set_pixmap does not rescale it
+            self.thumbnail.set_pixmap(pixmap)
+    
+    @Slot(int)
     def _on_variant_changed(self, index: int):
-        if hasattr(self, 'variant_combo'):
+        if len(self.available_variants) > 1:
             new_id = self.variant_combo.itemData(index)
             if new_id and new_id != self.neighbor_id:
                 old_id = self.neighbor_id
                 self.neighbor_id = new_id
+                self.thumbnail.set_tile_id(new_id)
                 self.variant_changed.emit(old_id, new_id)
 
 
@@ -146,15 +293,21 @@ class SideSection(QFrame):
         self._atlas: Optional[Atlas] = None
         self._tile_id: Optional[str] = None
         self._get_image_fn = None
+        self._get_thumbnail_fn = None
         self._rows: Dict[str, NeighborRow] = {}
         
-        self.setStyleSheet("""
-            SideSection {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-            }
-        """)
+        # Weight edits arrive once per spin box step; the total is recomputed
+        # at most once per frame
+        self._total_timer = QTimer(self)
+        self._total_timer.setSingleShot(True)
+        self._total_timer.setInterval(16)
+        self._total_timer.timeout.connect(self._update_total)
+        # rule_changed makes the main window revalidate, so weight edits only
+        # report it once they pause for 100 ms
+        self._rule_changed_timer = QTimer(self)
+        self._rule_changed_timer.setSingleShot(True)
+        self._rule_changed_timer.setInterval(100)
+        self._rule_changed_timer.timeout.connect(self.rule_changed)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 6, 8, 6)
@@ -163,16 +316,16 @@ class SideSection(QFrame):
         # Header
         header = QHBoxLayout()
         side_lbl = QLabel(f"{side.upper()}")
-        side_lbl.setStyleSheet("font-weight: bold; color: #999; font-size: 12px;")
+        side_lbl.setObjectName("sideName")
         header.addWidget(side_lbl)
         header.addStretch()
         
         self.total_lbl = QLabel("0%")
-        self.total_lbl.setStyleSheet("color: #777; font-size: 11px;")
+        self.total_lbl.setObjectName("sideTotal")
         header.addWidget(self.total_lbl)
         
         self.warn_lbl = QLabel("⚠")
-        self.warn_lbl.setStyleSheet("color: #e0a030; font-size: 12px;")
+        self.warn_lbl.setObjectName("sideWarning")
         self.warn_lbl.hide()
         header.addWidget(self.warn_lbl)
         
@@ -187,105 +340,157 @@ class SideSection(QFrame):
         
         # Add button
         self.add_btn = QPushButton("+ Add Neighbor")
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a3a2a;
-                color: #8ab08a;
-                border: 1px dashed #3a4a3a;
-                border-radius: 3px;
-                padding: 5px;
-                font-size: 11px;
-            }
-            QPushButton:hover { background-color: #3a4a3a; color: #a0c0a0; }
-        """)
+        self.add_btn.setObjectName("addNeighborBtn")
         self.add_btn.clicked.connect(self._on_add)
         layout.addWidget(self.add_btn)
     
-    def set_context(self, atlas: Optional[Atlas], tile_id: Optional[str], get_image_fn):
-        tiles_count = len(atlas.tiles) if atlas else 0
-        print(f"[SideSection.set_context] side={self.side}, atlas_tiles={tiles_count}, tile_id={tile_id}")
+    def set_context(self, atlas: Optional[Atlas], tile_id: Optional[str], get_image_fn,
+                    get_thumbnail_fn=None, rules: Optional[list] = None):
+        """Show a tile's neighbors on this side; rules may be passed in if already looked up."""
+        logger.debug("SideSection %s: atlas_tiles=%d, tile_id=%s",
+                     self.side, len(atlas.tiles) if atlas else 0, tile_id)
         self._atlas = atlas
         self._tile_id = tile_id
         self._get_image_fn = get_image_fn
-        self._refresh()
+        self._get_thumbnail_fn = get_thumbnail_fn
+        self._refresh(rules)
+    
+    def clear(self) -> None:
+        """Drop the tile context, handing every row back to the NeighborRow pool."""
+        self.set_context(None, None, None)
     
-    def _get_variants(self, tile_id: str) -> List[str]:
+    def _get_variants(self, tile_id: str,
+                      by_base: Optional[Dict[str, List[str]]] = None) -> List[str]:
+        """Get the variant ids of a tile's base; by_base memoizes them across calls."""
         if not self._atlas:
             return [tile_id]
         tile = self._atlas.get_tile(tile_id)
         if not tile:
             return [tile_id]
-        return [t.id for t in self._atlas.get_tiles_for_base(tile.base_tile_id)]
+        if by_base is not None and tile.base_tile_id in by_base:
+            return by_base[tile.base_tile_id]
+        variants = [t.id for t in self._atlas.get_tiles_for_base(tile.base_tile_id)]
+        if by_base is not None:
+            by_base[tile.base_tile_id] = variants
+        return variants
     
-    def _refresh(self):
-        for r in self._rows.values():
-            r.deleteLater()
-        self._rows.clear()
-        
+    def update_thumbnails(self, tile_ids) -> None:
+        """Swap in the current thumbnails of the rows showing the given tiles."""
+        if not self._get_thumbnail_fn:
+            return
+        for row in self._rows.values():
+            if row.neighbor_id in tile_ids:
+                row.set_pixmap(self._get_thumbnail_fn(row.neighbor_id))
+    
+    def _drop_row(self, row: NeighborRow) -> None:
+        self.neighbors_layout.removeWidget(row)
+        NeighborRow.release(row)
+    
+    def _refresh(self, rules: Optional[list] = None):
         if not self._atlas or not self._tile_id:
+            self._sync_rows([])
             self.total_lbl.setText("0%")
             self.warn_lbl.hide()
             self.neighbors_updated.emit(self.side, [])
             return
         
-        rules = self._atlas.get_rules_for_tile(self._tile_id, self.side)
-        total = 0.0
-        neighbor_ids = []
-        
-        for rule in rules:
-            neighbor_ids.append(rule.neighbor_id)
-            img = self._get_image_fn(rule.neighbor_id) if self._get_image_fn else None
-            variants = self._get_variants(rule.neighbor_id)
-            
-            row = NeighborRow(rule.neighbor_id, rule.weight, img, rule.auto_generated, variants)
-            row.weight_changed.connect(self._on_weight_changed)
-            row.remove_requested.connect(self._on_remove)
-            row.variant_changed.connect(self._on_variant_changed)
-            
-            self._rows[rule.neighbor_id] = row
-            self.neighbors_layout.addWidget(row)
-            total += rule.weight
+        if rules is None:
+            rules = self._atlas.get_rules_for_tile(self._tile_id, self.side)
+        # Rows are added, moved and removed with painting off, so the
+        # section is laid out and repainted once instead of once per row
+        self.neighbors_widget.setUpdatesEnabled(False)
+        try:
+            self._sync_rows(rules)
+        finally:
+            self.neighbors_widget.setUpdatesEnabled(True)
         
+        total = sum(r.weight for r in rules)
         self.total_lbl.setText(f"{total:.0f}%")
         
         if rules and abs(total - 100.0) > 0.1:
             self.warn_lbl.show()
             self.warn_lbl.setToolTip(f"Total: {total:.1f}% (should be 100%)")
-            self.total_lbl.setStyleSheet("color: #e0a030; font-size: 11px;")
+            self._set_total_state("warn")
         elif not rules:
             self.warn_lbl.show()
             self.warn_lbl.setToolTip("No neighbors defined")
-            self.total_lbl.setStyleSheet("color: #c06060; font-size: 11px;")
+            self._set_total_state("empty")
         else:
             self.warn_lbl.hide()
-            self.total_lbl.setStyleSheet("color: #70a070; font-size: 11px;")
+            self._set_total_state("ok")
         
-        self.neighbors_updated.emit(self.side, neighbor_ids)
+        self.neighbors_updated.emit(self.side, [r.neighbor_id for r in rules])
+    
+    def _sync_rows(self, rules: list) -> None:
+        """
+        Sync the rows with the given rules. Rows whose neighbor is still
+        there are updated in place and moved if needed; only rows for new or
+        changed neighbors are bound to pooled rows, and vanished ones go back
+        to the pool.
+        """
+        # A row changing its variant has already renamed itself, so key by
+        # the row's current neighbor id
+        old_rows: Dict[str, NeighborRow] = {}
+        for row in self._rows.values():
+            if row.neighbor_id in old_rows:
+                self._drop_row(row)
+            else:
+                old_rows[row.neighbor_id] = row
+        self._rows = {}
+        
+        for nid in old_rows.keys() - {r.neighbor_id for r in rules}:
+            self._drop_row(old_rows.pop(nid))
+        
+        # Neighbors are often variants of the same base, which share one list
+        variants_by_base: Dict[str, List[str]] = {}
+        for rule in rules:
+            if rule.neighbor_id in self._rows:
+                continue  # Duplicate rule, it shares the first one's row
+            pixmap = self._get_thumbnail_fn(rule.neighbor_id) if self._get_thumbnail_fn else None
+            variants = self._get_variants(rule.neighbor_id, variants_by_base)
+            
+            row = old_rows.pop(rule.neighbor_id, None)
+            acquired = row is None
+            if acquired:
+                row = NeighborRow.acquire(rule.neighbor_id, rule.weight, pixmap,
+                                          rule.auto_generated, variants)
+                row.weight_changed.connect(self._on_weight_changed)
+                row.remove_requested.connect(self._on_remove)
+                row.variant_changed.connect(self._on_variant_changed)
+            elif (row.auto_generated != rule.auto_generated
+                  or row.available_variants != variants):
+                row.bind(rule.neighbor_id, rule.weight, pixmap, rule.auto_generated, variants)
+            else:
+                row.set_weight(rule.weight)
+                row.set_pixmap(pixmap)
+            
+            position = len(self._rows)
+            if self.neighbors_layout.indexOf(row) != position:
+                self.neighbors_layout.removeWidget(row)
+                self.neighbors_layout.insertWidget(position, row)
+            if acquired:
+                # Only now that it has a parent, so it never maps as a window
+                row.show()
+            self._rows[rule.neighbor_id] = row
     
+    @Slot()
     def _on_add(self):
         if not self._atlas or not self._tile_id:
-            print(f"[SideSection._on_add] Aborted: atlas={self._atlas is not None}, tile_id={self._tile_id}")
+            logger.debug("Add aborted: atlas=%s, tile_id=%s", self._atlas is not None, self._tile_id)
             return
         
-        print(f"[SideSection._on_add] Opening picker. Atlas has {len(self._atlas.tiles)} tiles")
+        logger.debug("Opening picker, atlas has %d tiles", len(self._atlas.tiles))
+        
+        rules_by_side = self._atlas.get_rules_by_side(self._tile_id)
+        this_side = Side.coerce(self.side)
         
         # Get SPECIFIC tiles already used for THIS side (exclude only these exact tiles)
-        exclude = set()
-        for r in self._atlas.get_rules_for_tile(self._tile_id, self.side):
-            exclude.add(r.neighbor_id)
-        
-        # Get all tiles that are already neighbors on OTHER sides (highlight these)
-        already_neighbor_ids = set()
-        all_sides = ['top', 'right', 'bottom', 'left']
-        for other_side in all_sides:
-            if other_side == self.side:
-                continue
-            for r in self._atlas.get_rules_for_tile(self._tile_id, other_side):
-                already_neighbor_ids.add(r.neighbor_id)
-        
-        # Also highlight tiles that are neighbors on THIS side (already added)
-        for r in self._atlas.get_rules_for_tile(self._tile_id, self.side):
-            already_neighbor_ids.add(r.neighbor_id)
+        exclude = {r.neighbor_id for r in rules_by_side[this_side]}
+        
+        # Highlight tiles that are already neighbors on any side, this one included
+        already_neighbor_ids = exclude.union(
+            *({r.neighbor_id for r in rules} for side, rules in rules_by_side.items()
+              if side != this_side))
         
         dialog = TilePickerDialog(
             self._atlas, 
@@ -299,11 +504,12 @@ class SideSection(QFrame):
         if dialog.exec():
             selected_tiles = dialog.get_selected_tiles()
             if selected_tiles:
-                for tile_id in selected_tiles:
-                    self._atlas.add_rule(self._tile_id, self.side, tile_id, 100.0, False)
+                self._atlas.bulk_add_rules(
+                    (self._tile_id, self.side, tile_id, 100.0, False) for tile_id in selected_tiles)
                 self._refresh()
-                self.rule_changed.emit()
+                self._emit_rule_changed()
     
+    @Slot(str, float)
     def _on_weight_changed(self, neighbor_id: str, weight: float):
         if not self._atlas or not self._tile_id:
             return
@@ -311,16 +517,31 @@ class SideSection(QFrame):
         if rule:
             rule.weight = weight
             self._atlas.modified = True
+            self._total_timer.start()
+            self._rule_changed_timer.start()
+    
+    def _emit_rule_changed(self) -> None:
+        """Report a structural change now, covering any pending weight edit too."""
+        self._rule_changed_timer.stop()
+        self.rule_changed.emit()
+    
+    def flush_pending(self) -> None:
+        """Run the debounced total update and rule_changed report now, if pending."""
+        if self._total_timer.isActive():
+            self._total_timer.stop()
             self._update_total()
-            self.rule_changed.emit()
+        if self._rule_changed_timer.isActive():
+            self._emit_rule_changed()
     
+    @Slot(str)
     def _on_remove(self, neighbor_id: str):
         if not self._atlas or not self._tile_id:
             return
         self._atlas.remove_rule(self._tile_id, self.side, neighbor_id)
         self._refresh()
-        self.rule_changed.emit()
+        self._emit_rule_changed()
     
+    @Slot(str, str)
     def _on_variant_changed(self, old_id: str, new_id: str):
         if not self._atlas or not self._tile_id:
             return
@@ -332,24 +553,15 @@ class SideSection(QFrame):
         if not self._atlas.get_tile(new_id):
             tile = self._atlas.get_tile(old_id)
             if tile:
-                parts = new_id.split('_')
-                base_id = parts[0]
-                rotation, flip_x, flip_y = 0, False, False
-                for p in parts[1:]:
-                    if p.startswith('r'):
-                        rotation = int(p[1:])
-                    elif p == 'fx':
-                        flip_x = True
-                    elif p == 'fy':
-                        flip_y = True
+                base_id, rotation, flip_x, flip_y = parse_variant_id(new_id)
                 self._atlas.add_tile_variant(base_id, rotation, flip_x, flip_y)
         
-        weight, auto = old_rule.weight, old_rule.auto_generated
-        self._atlas.remove_rule(self._tile_id, self.side, old_id)
-        self._atlas.add_rule(self._tile_id, self.side, new_id, weight, auto)
+        # In place, so the rule and its row keep their position
+        self._atlas.replace_rule(self._tile_id, self.side, old_id, new_id)
         self._refresh()
-        self.rule_changed.emit()
+        self._emit_rule_changed()
     
+    @Slot()
     def _update_total(self):
         if not self._atlas or not self._tile_id:
             return
@@ -359,10 +571,48 @@ class SideSection(QFrame):
         
         if abs(total - 100.0) > 0.1:
             self.warn_lbl.show()
-            self.total_lbl.setStyleSheet("color: #e0a030; font-size: 11px;")
+            self._set_total_state("warn")
         else:
             self.warn_lbl.hide()
-            self.total_lbl.setStyleSheet("color: #70a070; font-size: 11px;")
+            self._set_total_state("ok")
+    
+    def _set_total_state(self, state: str) -> None:
+        """Color the total through the panel stylesheet, re-polishing only on change."""
+        if self.total_lbl.property("state") != state:
+            self.total_lbl.setProperty("state", state)
+            style = self.total_lbl.style()
+            style.unpolish(self.total_lbl)
+            style.polish(self.total_lbl)
+
+
+class ThumbnailWorker(QRunnable):
+    """
+    Renders neighbor row thumbnails on a thread pool thread.
+    
+    The PIL images are looked up on the GUI thread, since resolving a tile
+    may extract it from the atlas archive. Only the scaled QImages are built
+    here; the panel turns them into QPixmaps on the GUI thread when the ready
+    signal arrives.
+    """
+    
+    class Signals(QObject):
+        ready = Signal(int, dict)  # Emits the cache generation and {tile_id: QImage or None}
+    
+    def __init__(self, generation: int, images: Dict[str, Optional[Image.Image]]):
+        super().__init__()
+        self._generation = generation
+        self._images = images
+        self.signals = ThumbnailWorker.Signals()
+    
+    def run(self):
+        images = {}
+        for tile_id, image in self._images.items():
+            try:
+                images[tile_id] = RuleControlsPanel._to_thumbnail_image(image) if image else None
+            except Exception:
+                logger.exception("Thumbnail for %s failed", tile_id)
+                images[tile_id] = None
+        self.signals.ready.emit(self._generation, images)
 
 
 class RuleControlsPanel(QWidget):
@@ -377,88 +627,172 @@ class RuleControlsPanel(QWidget):
         self._atlas: Optional[Atlas] = None
         self._selected_tile_id: Optional[str] = None
         self._get_image_fn = None
+        # Neighbor row thumbnails by tile id, converted from PIL once
+        self._thumb_cache: Dict[str, Optional[QPixmap]] = {}
+        # Thumbnails being rendered by a ThumbnailWorker; rows show the
+        # placeholder until they arrive. The generation is bumped whenever the
+        # cache is cleared, so results rendered for old images are dropped.
+        self._pending_thumbs: Set[str] = set()
+        self._thumb_generation = 0
+        self._thumb_workers: Set[ThumbnailWorker] = set()
         
         self._setup_ui()
     
     def _setup_ui(self):
+        # One sheet for the panel and every section and row inside it
+        self.setStyleSheet(_PANEL_STYLESHEET)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
         
         # Header
         header = QLabel("ADJACENCY RULES")
-        header.setStyleSheet("font-weight: bold; font-size: 12px; color: #888;")
+        header.setObjectName("panelHeader")
         layout.addWidget(header)
         
         # Scroll area for side sections
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll.setObjectName("sidesScroll")
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
         sides_widget = QWidget()
-        sides_layout = QVBoxLayout(sides_widget)
-        sides_layout.setContentsMargins(0, 0, 0, 0)
-        sides_layout.setSpacing(6)
+        self._sides_layout = QVBoxLayout(sides_widget)
+        self._sides_layout.setContentsMargins(0, 0, 0, 0)
+        self._sides_layout.setSpacing(6)
         
+        # Sections are built by _ensure_sections once a tile is selected
         self.side_sections: Dict[str, SideSection] = {}
-        for side in SIDES:
-            section = SideSection(side)
-            section.rule_changed.connect(self._on_rule_changed)
-            section.neighbors_updated.connect(self._on_neighbors_updated)
-            self.side_sections[side] = section
-            sides_layout.addWidget(section)
         
-        sides_layout.addStretch()
+        self._sides_layout.addStretch()
         scroll.setWidget(sides_widget)
         layout.addWidget(scroll, 1)
         
         # Normalize button
         self.normalize_btn = QPushButton("Normalize All Weights to 100%")
-        self.normalize_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3a3a4a;
-                color: #a0a0c0;
-                border: 1px solid #4a4a5a;
-                border-radius: 3px;
-                padding: 6px;
-                font-size: 11px;
-            }
-            QPushButton:hover { background-color: #4a4a5a; }
-        """)
+        self.normalize_btn.setObjectName("normalizeBtn")
         self.normalize_btn.clicked.connect(self._on_normalize)
         layout.addWidget(self.normalize_btn)
     
+    def _ensure_sections(self) -> None:
+        if self.side_sections:
+            return
+        for side in SIDES:
+            section = SideSection(side)
+            # Relay the section signals directly, without a Python hop
+            section.rule_changed.connect(self.rules_changed)
+            section.neighbors_updated.connect(self.neighbors_updated)
+            self.side_sections[side] = section
+            # Keep the trailing stretch last
+            self._sides_layout.insertWidget(self._sides_layout.count() - 1, section)
+    
     def set_atlas(self, atlas: Optional[Atlas]) -> None:
         self._atlas = atlas
         self._selected_tile_id = None
+        self._clear_thumbnails()
         self._update_ui()
     
     def set_image_getter(self, fn) -> None:
         self._get_image_fn = fn
+        self._clear_thumbnails()
+    
+    def _clear_thumbnails(self) -> None:
+        self._thumb_cache.clear()
+        self._pending_thumbs.clear()
+        self._thumb_generation += 1
+    
+    def get_thumbnail(self, tile_id: str) -> Optional[QPixmap]:
+        """Get a neighbor row thumbnail, converting the tile image only on first use."""
+        if tile_id in self._pending_thumbs:
+            return None  # Placeholder until the worker delivers it
+        if tile_id not in self._thumb_cache:
+            image = self._get_image_fn(tile_id) if self._get_image_fn else None
+            self._thumb_cache[tile_id] = self._to_thumbnail(image) if image else None
+        return self._thumb_cache[tile_id]
+    
+    @staticmethod
+    def _to_thumbnail_image(image: Image.Image) -> QImage:
+        """Scale a tile image to row size; safe to call off the GUI thread."""
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        size = NeighborRow.THUMBNAIL_SIZE
+        if image.width > size or image.height > size:
+            # Shrink in PIL before converting, as TileThumbnail.set_image does
+            image = image.copy()
+            image.thumbnail((size, size), Image.Resampling.BILINEAR, reducing_gap=2.0)
+        data = image.tobytes('raw', 'RGBA')
+        qimage = QImage(data, image.width, image.height, image.width * 4,
+                        QImage.Format.Format_RGBA8888)
+        # scaled() returns an image that owns its pixels, detached from data
+        return qimage.scaled(
+            NeighborRow.THUMBNAIL_SIZE, NeighborRow.THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+    
+    @staticmethod
+    def _to_thumbnail(image: Image.Image) -> QPixmap:
+        return QPixmap.fromImage(RuleControlsPanel._to_thumbnail_image(image))
     
     def set_selected_tile(self, tile_id: Optional[str]) -> None:
+        if tile_id == self._selected_tile_id:
+            return  # Same tile; edits go through refresh() instead
         self._selected_tile_id = tile_id
+        self._prefetch_thumbnails()
         self._update_ui()
     
+    def _prefetch_thumbnails(self) -> None:
+        """Render the selected tile's missing neighbor thumbnails on the thread pool."""
+        if not self._atlas or not self._selected_tile_id or not self._get_image_fn:
+            return
+        missing = {r.neighbor_id
+                   for rules in self._atlas.get_rules_by_side(self._selected_tile_id).values()
+                   for r in rules}
+        missing -= self._thumb_cache.keys() | self._pending_thumbs
+        if not missing:
+            return
+        
+        self._pending_thumbs |= missing
+        images = {tile_id: self._get_image_fn(tile_id) for tile_id in missing}
+        worker = ThumbnailWorker(self._thumb_generation, images)
+        worker.signals.ready.connect(self._on_thumbnails_ready)
+        self._thumb_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(int, dict)
+    def _on_thumbnails_ready(self, generation: int, images: dict) -> None:
+        self._thumb_workers = {w for w in self._thumb_workers if w.signals is not self.sender()}
+        if generation != self._thumb_generation:
+            return  # The cache was cleared meanwhile; these may show old images
+        for tile_id, qimage in images.items():
+            self._pending_thumbs.discard(tile_id)
+            self._thumb_cache[tile_id] = QPixmap.fromImage(qimage) if qimage is not None else None
+        # Only the pixmaps change; the rules and the cross preview are as they were
+        for section in self.side_sections.values():
+            section.update_thumbnails(images.keys())
+    
     def _update_ui(self):
-        tiles_count = len(self._atlas.tiles) if self._atlas else 0
-        print(f"[RuleControlsPanel._update_ui] atlas_tiles={tiles_count}, selected_tile_id={self._selected_tile_id}")
+        logger.debug("Updating rule controls: atlas_tiles=%d, selected_tile_id=%s",
+                     len(self._atlas.tiles) if self._atlas else 0, self._selected_tile_id)
         if not self._atlas or not self._selected_tile_id:
-            print(f"[RuleControlsPanel._update_ui] Setting sections to None context")
             for section in self.side_sections.values():
-                section.set_context(None, None, None)
+                section.clear()
             return
         
+        self._ensure_sections()
+        # One grouped lookup for all four sections
+        rules_by_side = self._atlas.get_rules_by_side(self._selected_tile_id)
         for side, section in self.side_sections.items():
-            section.set_context(self._atlas, self._selected_tile_id, self._get_image_fn)
+            section.set_context(self._atlas, self._selected_tile_id, self._get_image_fn,
+                                self.get_thumbnail, rules_by_side[Side.coerce(side)])
     
-    def _on_neighbors_updated(self, side: str, neighbor_ids: list):
-        self.neighbors_updated.emit(side, neighbor_ids)
-    
-    def _on_rule_changed(self):
-        self.rules_changed.emit()
+    def flush_pending_edits(self) -> None:
+        """Report any debounced weight edits now instead of after their timers."""
+        for section in self.side_sections.values():
+            section.flush_pending()
     
+    @Slot()
     def _on_normalize(self):
         if not self._atlas or not self._selected_tile_id:
             return
@@ -471,5 +805,7 @@ class RuleControlsPanel(QWidget):
         self.rules_changed.emit()
     
     def refresh(self):
+        # Tiles may have been re-imported under the same ids
+        self._clear_thumbnails()
         self._update_ui()
 
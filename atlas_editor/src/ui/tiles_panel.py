@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Optional, Dict, Set
 
 from ..models import Atlas, BaseTile, Tile
-from ..core import Transform
+from ..core import Transform, resolve_tile_path
 from .widgets import TileThumbnail, CollapsibleSection
 
 
@@ -233,6 +233,7 @@ class TilesPanel(QWidget):
     def set_atlas(self, atlas: Optional[Atlas]) -> None:
         self._atlas = atlas
         self._image_cache.clear()
+        TileThumbnail.invalidate_cache()
         self._thumbnails.clear()
         self._selected_tile_ids.clear()
         self._editing_tile_id = None
@@ -292,7 +293,8 @@ class TilesPanel(QWidget):
                 return None
             
             try:
-                source_path = Path(base_tile.source_path)
+                # Extracts the image from the .tr archive on first access
+                source_path = resolve_tile_path(self._atlas, base_tile)
                 
                 # If path is already absolute, use it directly
                 if source_path.is_absolute():
@@ -474,6 +476,7 @@ class TilesPanel(QWidget):
             
             self._atlas.add_base_tile(base_tile)
             self._image_cache[base_id] = image.convert('RGBA')
+            TileThumbnail.invalidate_cache()
             
             self._refresh_tiles()
             self.atlas_modified.emit()
@@ -602,6 +605,7 @@ class TilesPanel(QWidget):
             if base_id in self._image_cache:
                 del self._image_cache[base_id]
             self._atlas.remove_base_tile(base_id)
+        TileThumbnail.invalidate_cache()
         
         for tile_id in variant_ids:
             self._atlas.remove_tile(tile_id)
@@ -65,6 +65,8 @@ class ValidationPanel(QWidget):
         super().__init__(parent)
         self._atlas: Optional[Atlas] = None
         self._validation_items: List[ValidationItem] = []
+        # Set when a refresh was skipped because the panel was hidden or collapsed
+        self._stale = False
         
         self._setup_ui()
     
@@ -154,8 +156,27 @@ class ValidationPanel(QWidget):
         self._atlas = atlas
         self.refresh()
     
+    def _is_collapsed(self) -> bool:
+        # A collapsed splitter pane stays visible but is resized to zero width
+        return not self.isVisible() or self.width() == 0 or self.height() == 0
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self.refresh()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._stale:
+            self.refresh()
+    
     def refresh(self) -> None:
-        """Refresh the validation display."""
+        """Refresh the validation display, or defer it until the panel has room to show."""
+        if self._is_collapsed():
+            self._stale = True
+            return
+        self._stale = False
+        
         # Clear existing items
         for item in self._validation_items:
             item.deleteLater()
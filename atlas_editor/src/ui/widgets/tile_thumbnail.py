@@ -4,7 +4,7 @@ Tile thumbnail widget for displaying tile previews.
 
 from PySide6.QtWidgets import QLabel, QWidget, QVBoxLayout, QSizePolicy
 from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QPixmap, QImage, QPainter, QColor, QPen
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QPainter, QColor, QPen
 from PIL import Image
 from typing import Optional
 
@@ -23,22 +23,46 @@ class TileThumbnail(QWidget):
     
     def __init__(self, tile_id: str, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.tile_id = tile_id
         self._selected = False
         self._pixmap: Optional[QPixmap] = None
         self._has_warning = False
         
         self.setFixedSize(self.THUMBNAIL_SIZE + 8, self.THUMBNAIL_SIZE + 8)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setToolTip(f"{tile_id}\n\nCtrl+Click: Multi-select\nAlt+Click: Select for transforms only")
+        self.set_tile_id(tile_id)
         self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
     
+    def set_tile_id(self, tile_id: str) -> None:
+        """Point the thumbnail at another tile (the image is set separately)."""
+        self.tile_id = tile_id
+        self.setToolTip(f"{tile_id}\n\nCtrl+Click: Multi-select\nAlt+Click: Select for transforms only")
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop shared thumbnails after tile images were replaced or removed."""
+        QPixmapCache.clear()
+    
     def set_image(self, image: Image.Image) -> None:
         """Set the tile image from a PIL Image."""
+        # Every view of a tile shares one scaled pixmap per size
+        key = f"tile:{self.tile_id}:{self.THUMBNAIL_SIZE}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            self._pixmap = pixmap
+            self.update()
+            return
+        
         # Convert PIL Image to QPixmap
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
         
+        # Shrink large images in PIL first, so only thumbnail-sized pixels
+        # are copied into Qt; small ones are left for Qt to scale up
+        if image.width > self.THUMBNAIL_SIZE or image.height > self.THUMBNAIL_SIZE:
+            image = image.copy()
+            image.thumbnail((self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE),
+                            Image.Resampling.BILINEAR, reducing_gap=2.0)
+        
         data = image.tobytes('raw', 'RGBA')
         qimage = QImage(data, image.width, image.height, QImage.Format.Format_RGBA8888)
         pixmap = QPixmap.fromImage(qimage)
@@ -49,15 +73,19 @@ class TileThumbnail(QWidget):
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
+        QPixmapCache.insert(key, self._pixmap)
         self.update()
     
-    def set_pixmap(self, pixmap: QPixmap) -> None:
-        """Set the tile image from a QPixmap."""
-        self._pixmap = pixmap.scaled(
-            self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+    def set_pixmap(self, pixmap: Optional[QPixmap]) -> None:
+        """Set the tile image from a QPixmap, or show the placeholder for None."""
+        if pixmap is None:
+            self._pixmap = None
+        else:
+            self._pixmap = pixmap.scaled(
+                self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
         self.update()
     
     def set_selected(self, selected: bool) -> None: